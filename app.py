@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+from application_pages.calibration import load_all_model_versions, model_versions_signature
+from application_pages.page1 import keep_widget_state
 
 st.set_page_config(page_title="QuLab", layout="wide")
 st.sidebar.image("https://www.quantuniversity.com/assets/img/logo5.jpg")
@@ -65,6 +67,13 @@ def _init_state():
     }
     st.session_state.learning_pathways_df = pd.DataFrame(learning_pathways_data)
 
+    pathway_skill_impacts_data = {
+        'pathway_id': [1, 1, 2, 2, 3, 3],
+        'skill_name': ['Machine Learning', 'AI Ethics', 'Python', 'Data Visualization', 'User Research', 'AI Ethics'],
+        'skill_gain': [15, 10, 10, 15, 10, 15]
+    }
+    st.session_state.pathway_skill_impacts_df = pd.DataFrame(pathway_skill_impacts_data)
+
     occupation_required_skills_data = {
         'occupation_name': ['Data Analyst with AI Skills'] * 3 + ['AI UX Researcher'] * 3,
         'skill_name': ['Python', 'Data Visualization', 'Machine Learning'] + ['User Research', 'UI Design', 'AI Ethics'],
@@ -86,7 +95,14 @@ def _init_state():
     st.session_state.initialized = True
 
 
+@st.cache_resource(show_spinner=False)
+def _model_version_names(signature):
+    # Reads model_versions/ once per directory change rather than on every rerun
+    return load_all_model_versions()
+
+
 _init_state()
+keep_widget_state()
 
 page = st.sidebar.selectbox(label="Navigation", options=["Overview & Inputs", "Scores & Insights", "Pathway Simulation"])
 st.sidebar.subheader("Global Parameters")
@@ -100,6 +116,11 @@ st.sidebar.slider(
     help="Coefficient for the Synergy component, amplifying the AI-Readiness Score when individual readiness aligns with market opportunity.",
     key="beta_weight",
 )
+st.sidebar.selectbox(
+    "Model Version", options=_model_version_names(model_versions_signature()),
+    help="Named weight set used for AI-Fluency, Domain-Expertise, $V^R$ and $H_{base}$. Fitted versions are loaded from the model_versions directory.",
+    key="model_version",
+)
 
 if page == "Overview & Inputs":
     from application_pages.page1 import run_page1
@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+
+from application_pages.core import get_model_weights
+
+# Vectorized (column-at-a-time) counterparts of the formulas in core.py.
+# Every function mirrors the scalar version's clamping and zero-guard rules so
+# that batch results match compute_all_scores row for row.
+
+EDUCATION_FOUNDATION = {
+    "PhD": 1.0,
+    "Master's": 0.8,
+    "Bachelor's": 0.6,
+    "Associate's/Certificate": 0.4,
+    "HS + significant coursework": 0.2,
+    "Some College": 0.3,
+}
+
+PROFILE_DEFAULTS = {
+    'prompting_score': 0.0, 'tools_score': 0.0, 'understanding_score': 0.0, 'datalit_score': 0.0,
+    'output_quality_with_ai': 0.0, 'output_quality_without_ai': 1.0,
+    'time_without_ai': 1.0, 'time_with_ai': 1.0,
+    'errors_caught': 0.0, 'total_ai_errors': 0.0,
+    'appropriate_trust_decisions': 0.0, 'total_decisions': 0.0,
+    'delta_proficiency': 0.0, 'delta_t_hours_invested': 1.0,
+    'years_experience': 0.0, 'portfolio_score': 0.0, 'recognition_score': 0.0, 'credentials_score': 0.0,
+    'cognitive_flexibility': 0.0, 'social_emotional_intelligence': 0.0, 'strategic_career_management': 0.0,
+}
+
+OCCUPATION_COLUMNS = [
+    'ai_enhancement_score', 'job_growth_rate_g', 'ai_skilled_wage', 'median_wage',
+    'education_years_required', 'experience_years_required',
+    'current_job_postings', 'previous_job_postings',
+    'remote_work_factor', 'local_demand', 'national_avg_demand',
+]
+
+
+def clip01(x):
+    return np.clip(np.asarray(x, dtype=float), 0.0, 1.0)
+
+
+def _safe_divide(num, den):
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    out = np.zeros(np.broadcast(num, den).shape, dtype=float)
+    np.divide(num, den, out=out, where=den > 0)
+    return out
+
+
+def _column(df, name, default):
+    if name in df.columns:
+        return pd.to_numeric(df[name], errors='coerce').fillna(default).to_numpy(dtype=float)
+    return np.full(len(df), float(default))
+
+
+def profile_arrays(profiles_df):
+    # Pull every numeric profile input into a float array, using the same
+    # defaults compute_all_scores applies to missing keys.
+    arrays = {name: _column(profiles_df, name, default) for name, default in PROFILE_DEFAULTS.items()}
+    if 'education_level' in profiles_df.columns:
+        # Missing levels take compute_all_scores' default, like the numeric columns
+        arrays['education_level'] = profiles_df['education_level'].fillna("Master's").to_numpy()
+    else:
+        arrays['education_level'] = np.full(len(profiles_df), "Master's", dtype=object)
+    return arrays
+
+
+# ------------------------- V^R -------------------------
+
+def batch_vr_components(arrays, model_version=None):
+    weights = get_model_weights(model_version)
+    f1, f2, f3, f4 = weights['ai_fluency']
+    d1, d2, d3 = weights['domain_expertise']
+
+    s1 = (arrays['prompting_score'] + arrays['tools_score'] + arrays['understanding_score'] + arrays['datalit_score']) / 4.0
+
+    productive = (arrays['output_quality_without_ai'] > 0) & (arrays['time_with_ai'] > 0)
+    s2_raw = np.where(
+        productive,
+        _safe_divide(arrays['output_quality_with_ai'], arrays['output_quality_without_ai']) * _safe_divide(arrays['time_without_ai'], arrays['time_with_ai']),
+        0.0,
+    )
+    s2 = clip01(s2_raw)
+
+    ratio1 = _safe_divide(arrays['errors_caught'], arrays['total_ai_errors'])
+    ratio2 = _safe_divide(arrays['appropriate_trust_decisions'], arrays['total_decisions'])
+    s3 = clip01(1.0 - (ratio1 + ratio2) / 2.0)
+
+    # dt == 0 yields 0.0 in compute_all_scores (directly or via ZeroDivisionError)
+    dt = arrays['delta_t_hours_invested']
+    s4_raw = np.divide(arrays['delta_proficiency'], dt, out=np.zeros_like(dt), where=dt != 0)
+    s4 = clip01(s4_raw)
+
+    ai_fluency = clip01(f1 * clip01(s1) + f2 * s2 + f3 * s3 + f4 * s4)
+
+    edu_levels = pd.Series(arrays['education_level'])
+    e_edu = edu_levels.map(EDUCATION_FOUNDATION).fillna(0.0).to_numpy(dtype=float)
+    years = arrays['years_experience']
+    e_exp = years / (years + (1.0 / 0.15))
+    e_spec = (arrays['portfolio_score'] + arrays['recognition_score'] + arrays['credentials_score']) / 3.0
+    domain_expertise = clip01(d1 * clip01(e_edu) + d2 * clip01(e_exp) + d3 * clip01(e_spec))
+
+    adaptive_capacity = clip01(
+        (arrays['cognitive_flexibility'] + arrays['social_emotional_intelligence'] + arrays['strategic_career_management']) / 3.0 / 100.0
+    )
+
+    return {
+        's1': s1, 's2_raw': s2_raw, 's2': s2, 's3': s3, 's4_raw': s4_raw, 's4': s4,
+        'ai_fluency': ai_fluency,
+        'e_edu': e_edu, 'e_exp': e_exp, 'e_spec': e_spec,
+        'domain_expertise': domain_expertise,
+        'adaptive_capacity': adaptive_capacity,
+    }
+
+
+def batch_vr_score(components, model_version=None):
+    w1, w2, w3 = get_model_weights(model_version)['idiosyncratic_readiness']
+    vr_01 = clip01(w1 * components['ai_fluency'] + w2 * components['domain_expertise'] + w3 * components['adaptive_capacity'])
+    return vr_01 * 100.0
+
+
+def batch_timing_factor(years_experience):
+    years = np.asarray(years_experience, dtype=float)
+    return np.where(years <= 0, 1.0, 1.0 + years / 5.0)
+
+
+# ------------------------- H^R -------------------------
+
+def batch_hr_components(occupations_df, model_version=None):
+    h1, h2, h3, h4 = get_model_weights(model_version)['base_opportunity']
+
+    cols = {name: pd.to_numeric(occupations_df[name], errors='coerce').to_numpy(dtype=float) for name in OCCUPATION_COLUMNS}
+
+    ai_enh = cols['ai_enhancement_score']
+    # Mirrors int() truncation in calculate_job_growth_projection (score is non-negative after clipping)
+    job_growth_01 = np.floor(np.clip(50.0 + cols['job_growth_rate_g'] * 100.0, 0.0, 100.0)) / 100.0
+    wage_prem = np.where(cols['median_wage'] > 0, _safe_divide(cols['ai_skilled_wage'] - cols['median_wage'], cols['median_wage']), 0.0)
+    entry_acc = 1.0 / (1.0 + 0.1 * (cols['education_years_required'] + cols['experience_years_required']))
+    h_base_01 = h1 * clip01(ai_enh) + h2 * clip01(job_growth_01) + h3 * clip01(wage_prem) + h4 * clip01(entry_acc)
+
+    return {
+        'ai_enh': ai_enh,
+        'job_growth_01': job_growth_01,
+        'wage_prem': wage_prem,
+        'entry_acc': entry_acc,
+        'h_base_01': h_base_01,
+        'current_job_postings': cols['current_job_postings'],
+        'previous_job_postings': cols['previous_job_postings'],
+        'local_demand': cols['local_demand'],
+        'national_avg_demand': cols['national_avg_demand'],
+        'remote_work_factor': cols['remote_work_factor'],
+    }
+
+
+def batch_growth_multiplier(current_job_postings, previous_job_postings, lambda_val=0.3):
+    prev = np.asarray(previous_job_postings, dtype=float)
+    ratio = _safe_divide(current_job_postings, prev)
+    lam = max(0.0, float(lambda_val))
+    return np.where(prev > 0, np.power(ratio, lam), 1.0)
+
+
+def batch_regional_multiplier(local_demand, national_avg_demand, remote_work_factor, gamma=0.2):
+    nad = np.asarray(national_avg_demand, dtype=float)
+    nad = np.where(nad > 0, nad, 1.0)
+    return 1.0 + float(gamma) * (np.asarray(local_demand, dtype=float) / nad + np.asarray(remote_work_factor, dtype=float) - 1.0)
+
+
+def batch_hr_score(hr_components, lambda_val=0.3, gamma_val=0.2):
+    m_growth = batch_growth_multiplier(hr_components['current_job_postings'], hr_components['previous_job_postings'], lambda_val)
+    m_regional = batch_regional_multiplier(hr_components['local_demand'], hr_components['national_avg_demand'], hr_components['remote_work_factor'], gamma_val)
+    return clip01(hr_components['h_base_01'] * m_growth * m_regional) * 100.0
+
+
+# ------------------------- Synergy & AI-R -------------------------
+
+def batch_synergy_and_ai_r(vr_100, hr_100, skills_match, timing_factor, max_possible_match=100.0, alpha=0.6, beta=0.15):
+    max_match = float(max_possible_match) if float(max_possible_match) > 0 else 100.0
+    alignment = (np.asarray(skills_match, dtype=float) / max_match) * timing_factor
+    synergy_pct = np.clip(vr_100 * hr_100 * alignment / 100.0, 0.0, 100.0)
+    ai_r = float(alpha) * vr_100 + (1.0 - float(alpha)) * hr_100 + float(beta) * synergy_pct
+    return alignment, synergy_pct, ai_r
+
+
+# ------------------------- Pathway Projection -------------------------
+
+def batch_pathway_projection(components, hr_100, alignment, pathways_df, alpha=0.6, beta=0.15, completion_score=1.0, mastery_score=1.0, model_version=None):
+    # simulate_pathway_impact + the page3 recombination for every (profile, pathway)
+    # pair at once. Returns N x P arrays. H^R is held fixed; alignment is either one
+    # value per profile or an N x P array of skill-projected alignments.
+    w1, w2, w3 = get_model_weights(model_version)['idiosyncratic_readiness']
+    scale = float(completion_score) * float(mastery_score)
+    impacts = pathways_df[['impact_ai_fluency', 'impact_domain_expertise', 'impact_adaptive_capacity']].to_numpy(dtype=float) * scale
+
+    fluency = clip01(components['ai_fluency'][:, None] + impacts[None, :, 0])
+    expertise = clip01(components['domain_expertise'][:, None] + impacts[None, :, 1])
+    adaptive = clip01(components['adaptive_capacity'][:, None] + impacts[None, :, 2])
+    vr_100 = clip01(w1 * fluency + w2 * expertise + w3 * adaptive) * 100.0
+
+    hr_100 = np.broadcast_to(np.asarray(hr_100, dtype=float).reshape(-1, 1), vr_100.shape)
+    alignment = np.asarray(alignment, dtype=float)
+    if alignment.ndim < 2:
+        alignment = alignment.reshape(-1, 1)
+    synergy_pct = np.clip(vr_100 * hr_100 * alignment / 100.0, 0.0, 100.0)
+    ai_r = float(alpha) * vr_100 + (1.0 - float(alpha)) * hr_100 + float(beta) * synergy_pct
+    return {
+        'ai_fluency': fluency,
+        'domain_expertise': expertise,
+        'adaptive_capacity': adaptive,
+        'vr_score': vr_100,
+        'synergy_pct': synergy_pct,
+        'ai_r': ai_r,
+    }
@@ -0,0 +1,235 @@
+import itertools
+import json
+import os
+
+import numpy as np
+
+from application_pages.core import DEFAULT_WEIGHTS, MODEL_VERSIONS, register_model_version
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'model_versions')
+
+
+# ------------------------- Constrained Least Squares -------------------------
+
+def _objective(G, b, w):
+    # ||Xw - r||^2 up to the constant r^T r
+    return float(w @ G @ w - 2.0 * b @ w)
+
+
+def _simplex_lstsq(G, b, tol=1e-10):
+    # Exact minimum over {w >= 0, sum(w) = 1}: the optimum lies on one support set,
+    # and each support is an equality-constrained solve (k <= 4, so <= 15 supports)
+    k = len(b)
+    best, best_obj = None, np.inf
+    for support in range(1, 2 ** k):
+        idx = [i for i in range(k) if support >> i & 1]
+        n = len(idx)
+        A = np.zeros((n + 1, n + 1))
+        A[:n, :n] = G[np.ix_(idx, idx)]
+        A[:n, n] = 1.0
+        A[n, :n] = 1.0
+        sol = np.linalg.lstsq(A, np.append(b[idx], 1.0), rcond=None)[0]
+        w = np.zeros(k)
+        w[idx] = sol[:n]
+        if w.min() < -tol or w.sum() <= 0:
+            continue
+        w = np.maximum(w, 0.0)
+        w /= w.sum()
+        obj = _objective(G, b, w)
+        if obj < best_obj:
+            best, best_obj = w, obj
+    return best
+
+
+def _box_lstsq(G, b, tol=1e-10):
+    # Exact minimum over [0, 1]^k: every coordinate is at a bound or free (3^k cases)
+    k = len(b)
+    best, best_obj = None, np.inf
+    for states in itertools.product((0.0, 1.0, None), repeat=k):
+        free = [i for i, s in enumerate(states) if s is None]
+        fixed = [i for i, s in enumerate(states) if s is not None]
+        w = np.array([0.0 if s is None else s for s in states])
+        if free:
+            rhs = b[free] - G[np.ix_(free, fixed)] @ w[fixed]
+            w[free] = np.linalg.lstsq(G[np.ix_(free, free)], rhs, rcond=None)[0]
+            if w.min() < -tol or w.max() > 1.0 + tol:
+                continue
+            w = np.clip(w, 0.0, 1.0)
+        obj = _objective(G, b, w)
+        if obj < best_obj:
+            best, best_obj = w, obj
+    return best
+
+
+def _constrained_lstsq(X, r, w0, constraint):
+    # One pass over the data for X^T X and X^T r, then an exact solve of the
+    # small constrained problem, so block updates never stop short of the optimum
+    G = X.T @ X
+    b = X.T @ r
+    w = _simplex_lstsq(G, b) if constraint == 'simplex' else _box_lstsq(G, b)
+    return np.asarray(w0, dtype=float) if w is None else w
+
+
+# ------------------------- Model Evaluation -------------------------
+
+def _multiplier(cache, lambda_val, gamma_val):
+    # Growth x regional multiplier per profile (weight-independent given lambda/gamma)
+    lam = max(0.0, float(lambda_val))
+    m_growth = np.where(cache['has_growth'], np.power(cache['growth_ratio'], lam), 1.0)
+    m_regional = 1.0 + float(gamma_val) * cache['regional_term']
+    return (m_growth * m_regional)[cache['occupation_codes']]
+
+
+def predict_ai_r(cache, weights, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2):
+    # Full clamped formula chain from cached components, matching compute_all_scores
+    fluency = np.clip(cache['sub_scores'] @ np.asarray(weights['ai_fluency']), 0.0, 1.0)
+    expertise = np.clip(cache['expertise_components'] @ np.asarray(weights['domain_expertise']), 0.0, 1.0)
+    w1, w2, w3 = weights['idiosyncratic_readiness']
+    vr_100 = np.clip(w1 * fluency + w2 * expertise + w3 * cache['vr_components'][:, 2], 0.0, 1.0) * 100.0
+
+    h_base = (cache['h_components'] @ np.asarray(weights['base_opportunity']))[cache['occupation_codes']]
+    hr_100 = np.clip(h_base * _multiplier(cache, lambda_val, gamma_val), 0.0, 1.0) * 100.0
+
+    synergy_pct = np.clip(vr_100 * hr_100 * cache['alignment'] / 100.0, 0.0, 100.0)
+    return float(alpha) * vr_100 + (1.0 - float(alpha)) * hr_100 + float(beta) * synergy_pct
+
+
+# ------------------------- Fitting -------------------------
+
+def fit_weights(cache, outcomes, alpha=0.6, beta=0.15, lambda_val=0.3, gamma_val=0.2, fit_alpha_beta=False,
+                outcome_scale=100.0, initial_weights=None, max_iter=200, tol=1e-10):
+    # Block-coordinate least squares: AI-R is linear in each weight group when the
+    # others are held fixed, so every block is a small simplex-constrained LS solve
+    # over the cached components. Blocks are fitted on the unclamped model and the
+    # loop stops once that objective stops improving (relative tol); the reported
+    # loss uses the full clamped prediction.
+    # fit_alpha_beta=True also fits alpha/beta for diagnostics, but those are global
+    # sidebar parameters, so such a fit cannot be saved as a model version.
+    y = np.asarray(outcomes, dtype=float) * float(outcome_scale)
+    mask = ~np.isnan(y)
+    y = y[mask]
+
+    S = cache['sub_scores'][mask]
+    E = cache['expertise_components'][mask]
+    AC = cache['vr_components'][mask, 2]
+    codes = cache['occupation_codes'][mask]
+    Hc = cache['h_components'][codes]
+    M = _multiplier(cache, lambda_val, gamma_val)[mask]
+    align = cache['alignment'][mask]
+
+    base = DEFAULT_WEIGHTS if initial_weights is None else initial_weights
+    v = np.asarray(base['ai_fluency'], dtype=float)
+    d = np.asarray(base['domain_expertise'], dtype=float)
+    w = np.asarray(base['idiosyncratic_readiness'], dtype=float)
+    h = np.asarray(base['base_opportunity'], dtype=float)
+    ab = np.array([alpha, beta], dtype=float)
+
+    def parts():
+        F = S @ v
+        D = E @ d
+        VR = 100.0 * (w[0] * F + w[1] * D + w[2] * AC)
+        HR = 100.0 * M * (Hc @ h)
+        return F, D, VR, HR
+
+    def fit_sse():
+        # Unclamped model the blocks are solved on
+        F, D, VR, HR = parts()
+        pred = ab[0] * VR + (1.0 - ab[0]) * HR + ab[1] * VR * HR * align / 100.0
+        return float(np.mean((pred - y) ** 2))
+
+    def sse():
+        weights = {'ai_fluency': v, 'domain_expertise': d, 'idiosyncratic_readiness': w, 'base_opportunity': h}
+        pred = predict_ai_r(cache, weights, ab[0], ab[1], lambda_val, gamma_val)[mask]
+        return float(np.mean((pred - y) ** 2))
+
+    history = [sse()]
+    objective = [fit_sse()]
+    for _ in range(int(max_iter)):
+        # AI-R = VR * g + (1 - alpha) * HR with g = alpha + beta * HR * align / 100
+        F, D, VR, HR = parts()
+        g = ab[0] + ab[1] * HR * align / 100.0
+        c = (1.0 - ab[0]) * HR
+
+        w = _constrained_lstsq(100.0 * g[:, None] * np.column_stack([F, D, AC]), y - c, w, 'simplex')
+        v = _constrained_lstsq(100.0 * (g * w[0])[:, None] * S, y - c - 100.0 * g * (w[1] * D + w[2] * AC), v, 'simplex')
+        F = S @ v
+        d = _constrained_lstsq(100.0 * (g * w[1])[:, None] * E, y - c - 100.0 * g * (w[0] * F + w[2] * AC), d, 'simplex')
+
+        # AI-R = alpha * VR + HR * ((1 - alpha) + beta * VR * align / 100)
+        F, D, VR, HR = parts()
+        k = (1.0 - ab[0]) + ab[1] * VR * align / 100.0
+        h = _constrained_lstsq(100.0 * (M * k)[:, None] * Hc, y - ab[0] * VR, h, 'simplex')
+
+        if fit_alpha_beta:
+            # AI-R = HR + alpha * (VR - HR) + beta * Synergy
+            F, D, VR, HR = parts()
+            synergy = VR * HR * align / 100.0
+            ab = _constrained_lstsq(np.column_stack([VR - HR, synergy]), y - HR, ab, 'box')
+
+        history.append(sse())
+        objective.append(fit_sse())
+        if objective[-2] - objective[-1] <= tol * max(objective[-2], 1e-12):
+            break
+
+    return {
+        'weights': {
+            'ai_fluency': tuple(float(x) for x in v),
+            'domain_expertise': tuple(float(x) for x in d),
+            'idiosyncratic_readiness': tuple(float(x) for x in w),
+            'base_opportunity': tuple(float(x) for x in h),
+        },
+        'alpha': float(ab[0]),
+        'beta': float(ab[1]),
+        'lambda_val': float(lambda_val),
+        'gamma_val': float(gamma_val),
+        'fit_alpha_beta': bool(fit_alpha_beta),
+        'mse': history[-1],
+        'mse_history': history,
+        'n_samples': int(mask.sum()),
+    }
+
+
+# ------------------------- Model Versions on Disk -------------------------
+
+def save_model_version(name, fit_result, directory=MODEL_DIR):
+    # A model version is a weight set only; scoring always takes alpha/beta from the sidebar
+    if fit_result.get('fit_alpha_beta'):
+        raise ValueError("Fit includes fitted alpha/beta, which a model version cannot carry; refit with fit_alpha_beta=False")
+    os.makedirs(directory, exist_ok=True)
+    payload = {
+        'name': name,
+        'weights': {k: list(vals) for k, vals in fit_result['weights'].items()},
+        'mse': fit_result.get('mse'),
+        'n_samples': fit_result.get('n_samples'),
+    }
+    path = os.path.join(directory, f'{name}.json')
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+    register_model_version(name, fit_result['weights'])
+    return path
+
+
+def load_model_version(name, directory=MODEL_DIR):
+    with open(os.path.join(directory, f'{name}.json')) as f:
+        payload = json.load(f)
+    register_model_version(payload.get('name', name), payload['weights'])
+    return payload
+
+
+def model_versions_signature(directory=MODEL_DIR):
+    # Directory mtime changes whenever save_model_version adds or replaces a file
+    try:
+        return os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def load_all_model_versions(directory=MODEL_DIR):
+    if not os.path.isdir(directory):
+        return list(MODEL_VERSIONS)
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith('.json'):
+            load_model_version(filename[:-len('.json')], directory)
+    return list(MODEL_VERSIONS)
@@ -47,13 +47,13 @@ def calculate_ai_learning_velocity(delta_proficiency, delta_t_hours_invested):
     return dp / dt
 
 
-def calculate_ai_fluency(s1, s2, s3, s4):
+def calculate_ai_fluency(s1, s2, s3, s4, w1=0.1, w2=0.2, w3=0.3, w4=0.4):
     # Clamp each sub-score to [0,1] to maintain normalization
     s1c = clamp01(s1)
     s2c = clamp01(s2)
     s3c = clamp01(s3)
     s4c = clamp01(s4)
-    return 0.1 * s1c + 0.2 * s2c + 0.3 * s3c + 0.4 * s4c
+    return float(w1) * s1c + float(w2) * s2c + float(w3) * s3c + float(w4) * s4c
 
 
 # ------------------------- Domain-Expertise Sub-Components -------------------------
@@ -85,9 +85,9 @@ def calculate_specialization_depth(portfolio_score, recognition_score, credentia
     return (float(portfolio_score) + float(recognition_score) + float(credentials_score)) / 3.0
 
 
-def calculate_domain_expertise(education_foundation, practical_experience, specialization_depth):
+def calculate_domain_expertise(education_foundation, practical_experience, specialization_depth, w1=0.125, w2=0.25, w3=0.625):
     # Inputs are already in [0,1] ranges by construction
-    return 0.125 * clamp01(education_foundation) + 0.25 * clamp01(practical_experience) + 0.625 * clamp01(specialization_depth)
+    return float(w1) * clamp01(education_foundation) + float(w2) * clamp01(practical_experience) + float(w3) * clamp01(specialization_depth)
 
 
 # ------------------------- Adaptive-Capacity -------------------------
@@ -207,8 +207,54 @@ def simulate_pathway_impact(current_ai_fluency, current_domain_expertise, curren
     return clamp01(ai_fluency), clamp01(domain_expertise), clamp01(adaptive_capacity)
 
 
+# ------------------------- Model Versions -------------------------
+
+DEFAULT_WEIGHTS = {
+    'ai_fluency': (0.1, 0.2, 0.3, 0.4),
+    'domain_expertise': (0.125, 0.25, 0.625),
+    'idiosyncratic_readiness': (0.45, 0.35, 0.20),
+    'base_opportunity': (0.30, 0.30, 0.25, 0.15),
+}
+
+MODEL_VERSIONS = {'default': DEFAULT_WEIGHTS}
+
+
+def register_model_version(name, weights):
+    # Missing groups fall back to the default weights
+    merged = {}
+    for group, default in DEFAULT_WEIGHTS.items():
+        values = tuple(float(w) for w in weights.get(group, default))
+        if len(values) != len(default):
+            raise ValueError(f"Expected {len(default)} weights for '{group}', got {len(values)}")
+        merged[group] = values
+    MODEL_VERSIONS[name] = merged
+    return merged
+
+
+def get_model_weights(model_version=None):
+    name = 'default' if model_version is None else model_version
+    if name not in MODEL_VERSIONS:
+        raise KeyError(f"Unknown model version: {name}")
+    return MODEL_VERSIONS[name]
+
+
 # ------------------------- Orchestration -------------------------
 
+DEFAULT_OCCUPATION_ROW = {
+    'ai_enhancement_score': 0.8,
+    'job_growth_rate_g': 0.25,
+    'ai_skilled_wage': 120000,
+    'median_wage': 90000,
+    'education_years_required': 4,
+    'experience_years_required': 2,
+    'current_job_postings': 500,
+    'previous_job_postings': 400,
+    'remote_work_factor': 0.6,
+    'local_demand': 1.2,
+    'national_avg_demand': 1.0,
+}
+
+
 def compute_all_scores(inputs_dict):
     # Extract inputs safely
     prompting_score = inputs_dict.get('prompting_score', 0.0)
@@ -247,6 +293,9 @@ def compute_all_scores(inputs_dict):
     alpha = inputs_dict.get('alpha', 0.6)
     beta = inputs_dict.get('beta', 0.15)
 
+    model_version = inputs_dict.get('model_version', 'default')
+    weights = get_model_weights(model_version)
+
     # Compute AI-Fluency components
     s1 = calculate_technical_ai_skills(prompting_score, tools_score, understanding_score, datalit_score)
     s2_raw = calculate_ai_augmented_productivity(output_quality_with_ai, output_quality_without_ai, time_without_ai, time_with_ai)
@@ -257,43 +306,31 @@ def compute_all_scores(inputs_dict):
         s4_raw = 0.0
     s4 = clamp01(s4_raw)
     s3 = calculate_critical_ai_judgment(errors_caught, total_ai_errors, appropriate_trust_decisions, total_decisions)
-    ai_fluency_01 = clamp01(calculate_ai_fluency(s1, s2, s3, s4))
+    ai_fluency_01 = clamp01(calculate_ai_fluency(s1, s2, s3, s4, *weights['ai_fluency']))
 
     # Compute Domain-Expertise
     e_edu = calculate_education_foundation(education_level)
     e_exp = calculate_practical_experience(years_experience, gamma=0.15)
     e_spec = calculate_specialization_depth(portfolio_score, recognition_score, credentials_score)
-    domain_expertise_01 = clamp01(calculate_domain_expertise(e_edu, e_exp, e_spec))
+    domain_expertise_01 = clamp01(calculate_domain_expertise(e_edu, e_exp, e_spec, *weights['domain_expertise']))
 
     # Adaptive-Capacity (0..1)
     adaptive_capacity_01 = clamp01(calculate_adaptive_capacity(cognitive_flexibility, social_emotional_intelligence, strategic_career_management))
 
     # Idiosyncratic Readiness V^R (0..1) and (0..100)
-    vr_01 = clamp01(calculate_idiosyncratic_readiness(ai_fluency_01, domain_expertise_01, adaptive_capacity_01))
+    vr_01 = clamp01(calculate_idiosyncratic_readiness(ai_fluency_01, domain_expertise_01, adaptive_capacity_01, *weights['idiosyncratic_readiness']))
     vr_100 = vr_01 * 100.0
 
     # Systematic Opportunity
     if occupation_row is None:
         # Construct a safe default in case not provided
-        occupation_row = {
-            'ai_enhancement_score': 0.8,
-            'job_growth_rate_g': 0.25,
-            'ai_skilled_wage': 120000,
-            'median_wage': 90000,
-            'education_years_required': 4,
-            'experience_years_required': 2,
-            'current_job_postings': 500,
-            'previous_job_postings': 400,
-            'remote_work_factor': 0.6,
-            'local_demand': 1.2,
-            'national_avg_demand': 1.0,
-        }
+        occupation_row = DEFAULT_OCCUPATION_ROW
     ai_enh = calculate_ai_enhancement_potential(occupation_row['ai_enhancement_score'])
     job_growth_01 = calculate_job_growth_projection(occupation_row['job_growth_rate_g']) / 100.0
     wage_prem = calculate_wage_premium(occupation_row['ai_skilled_wage'], occupation_row['median_wage'])
     entry_acc = calculate_entry_accessibility(occupation_row['education_years_required'], occupation_row['experience_years_required'])
 
-    h_base_01 = calculate_base_opportunity_score(ai_enh, job_growth_01, wage_prem, entry_acc)
+    h_base_01 = calculate_base_opportunity_score(ai_enh, job_growth_01, wage_prem, entry_acc, *weights['base_opportunity'])
     m_growth = calculate_growth_multiplier(occupation_row['current_job_postings'], occupation_row['previous_job_postings'], lambda_val=lambda_val)
     m_regional = calculate_regional_multiplier(occupation_row['local_demand'], occupation_row['national_avg_demand'], occupation_row['remote_work_factor'], gamma=gamma_val)
     hr_01 = clamp01(calculate_systematic_opportunity(h_base_01, m_growth, m_regional))
@@ -337,4 +374,5 @@ def compute_all_scores(inputs_dict):
         'skills_match': skills_match,
         'timing_factor': timing_factor,
         'alignment': alignment,
+        'model_version': model_version,
     }
@@ -0,0 +1,219 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import EDUCATION_FOUNDATION, OCCUPATION_COLUMNS, PROFILE_DEFAULTS
+from application_pages.core import DEFAULT_OCCUPATION_ROW, get_model_weights
+
+# Numba is optional; without it the same kernel runs as plain Python
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Flat buffer layouts. The kernel reads these by position, so the order is fixed.
+PROFILE_FIELDS = [
+    'prompting_score', 'tools_score', 'understanding_score', 'datalit_score',
+    'output_quality_with_ai', 'output_quality_without_ai', 'time_without_ai', 'time_with_ai',
+    'errors_caught', 'total_ai_errors', 'appropriate_trust_decisions', 'total_decisions',
+    'delta_proficiency', 'delta_t_hours_invested',
+    'years_experience', 'portfolio_score', 'recognition_score', 'credentials_score',
+    'cognitive_flexibility', 'social_emotional_intelligence', 'strategic_career_management',
+    'education_foundation',
+]
+WEIGHT_GROUPS = ['ai_fluency', 'domain_expertise', 'idiosyncratic_readiness', 'base_opportunity']
+PARAM_FIELDS = ['lambda_val', 'gamma_val', 'max_possible_match', 'alpha', 'beta']
+PARAM_DEFAULTS = {'lambda_val': 0.3, 'gamma_val': 0.2, 'max_possible_match': 100.0, 'alpha': 0.6, 'beta': 0.15}
+
+KERNEL_OUTPUTS = [
+    'vr_score', 'hr_score', 'synergy_pct', 'ai_r',
+    'ai_fluency', 'domain_expertise', 'adaptive_capacity', 's1', 's2_raw', 's2', 's3', 's4_raw', 's4',
+    'ai_enh', 'job_growth_01', 'wage_prem', 'entry_acc', 'h_base_01', 'm_growth', 'm_regional',
+    'skills_match', 'timing_factor', 'alignment',
+]
+
+
+# ------------------------- Kernel -------------------------
+
+@njit(cache=True)
+def _clamp01(x):
+    return max(0.0, min(1.0, x))
+
+
+@njit(cache=True)
+def score_kernel(profile, occupation, weights, params, match_individual, match_required, match_importance, total_importance):
+    # compute_all_scores over flat float buffers (PROFILE_FIELDS, OCCUPATION_COLUMNS,
+    # WEIGHT_GROUPS flattened, PARAM_FIELDS) and pre-merged skill pairs.
+    # Returns a tuple ordered like KERNEL_OUTPUTS.
+
+    # AI-Fluency
+    s1 = (profile[0] + profile[1] + profile[2] + profile[3]) / 4.0
+    if profile[5] <= 0 or profile[7] <= 0:
+        s2_raw = 0.0
+    else:
+        s2_raw = (profile[4] / profile[5]) * (profile[6] / profile[7])
+    s2 = _clamp01(s2_raw)
+    ratio1 = profile[8] / profile[9] if profile[9] > 0 else 0.0
+    ratio2 = profile[10] / profile[11] if profile[11] > 0 else 0.0
+    s3 = _clamp01(1.0 - (ratio1 + ratio2) / 2.0)
+    # A zero-hour denominator scores 0, as compute_all_scores does on ZeroDivisionError
+    s4_raw = profile[12] / profile[13] if profile[13] != 0 else 0.0
+    s4 = _clamp01(s4_raw)
+    ai_fluency = _clamp01(weights[0] * _clamp01(s1) + weights[1] * s2 + weights[2] * s3 + weights[3] * s4)
+
+    # Domain-Expertise
+    years = profile[14]
+    e_exp = years / (years + (1.0 / 0.15))
+    e_spec = (profile[15] + profile[16] + profile[17]) / 3.0
+    domain_expertise = _clamp01(weights[4] * _clamp01(profile[21]) + weights[5] * _clamp01(e_exp) + weights[6] * _clamp01(e_spec))
+
+    # Adaptive-Capacity and V^R
+    adaptive_capacity = _clamp01((profile[18] + profile[19] + profile[20]) / 3.0 / 100.0)
+    vr_100 = _clamp01(weights[7] * ai_fluency + weights[8] * domain_expertise + weights[9] * adaptive_capacity) * 100.0
+
+    # H^R
+    ai_enh = occupation[0]
+    job_growth_01 = math.floor(max(0.0, min(50.0 + occupation[1] * 100.0, 100.0))) / 100.0
+    wage_prem = (occupation[2] - occupation[3]) / occupation[3] if occupation[3] > 0 else 0.0
+    entry_acc = 1.0 / (1.0 + 0.1 * (occupation[4] + occupation[5]))
+    h_base_01 = (weights[10] * _clamp01(ai_enh) + weights[11] * _clamp01(job_growth_01)
+                 + weights[12] * _clamp01(wage_prem) + weights[13] * _clamp01(entry_acc))
+    if occupation[7] <= 0:
+        m_growth = 1.0
+    else:
+        m_growth = (occupation[6] / occupation[7]) ** max(params[0], 0.0)
+    national = occupation[10] if occupation[10] > 0 else 1.0
+    m_regional = 1.0 + params[1] * (occupation[9] / national + occupation[8] - 1.0)
+    hr_100 = _clamp01(h_base_01 * m_growth * m_regional) * 100.0
+
+    # Synergy
+    skills_match = 0.0
+    if len(match_individual) > 0 and total_importance != 0:
+        weighted_sum = 0.0
+        for k in range(len(match_individual)):
+            weighted_sum += (min(match_individual[k], match_required[k]) / 100.0) * match_importance[k]
+        skills_match = (weighted_sum / total_importance) * 100.0
+    timing_factor = 1.0 if years <= 0 else 1.0 + years / 5.0
+    max_match = params[2] if params[2] > 0 else 100.0
+    alignment = (skills_match / max_match) * timing_factor
+    synergy_pct = max(0.0, min(100.0, vr_100 * hr_100 * alignment / 100.0))
+
+    ai_r = params[3] * vr_100 + (1.0 - params[3]) * hr_100 + params[4] * synergy_pct
+    return (vr_100, hr_100, synergy_pct, ai_r,
+            ai_fluency, domain_expertise, adaptive_capacity, s1, s2_raw, s2, s3, s4_raw, s4,
+            ai_enh, job_growth_01, wage_prem, entry_acc, h_base_01, m_growth, m_regional,
+            skills_match, timing_factor, alignment)
+
+
+# ------------------------- Packing -------------------------
+
+def _buffer(values):
+    # Numba wants contiguous float64 arrays; plain Python indexes lists faster
+    if HAVE_NUMBA:
+        return np.array(values, dtype=np.float64)
+    return [float(v) for v in values]
+
+
+def pack_profile(inputs_dict):
+    values = [inputs_dict.get(name, PROFILE_DEFAULTS[name]) for name in PROFILE_FIELDS[:-1]]
+    values.append(EDUCATION_FOUNDATION.get(inputs_dict.get('education_level', "Master's"), 0.0))
+    return _buffer(values)
+
+
+def pack_occupation(occupation_row=None):
+    row = DEFAULT_OCCUPATION_ROW if occupation_row is None else occupation_row
+    return _buffer([row[name] for name in OCCUPATION_COLUMNS])
+
+
+def pack_weights(model_version=None):
+    weights = get_model_weights(model_version)
+    return _buffer([w for group in WEIGHT_GROUPS for w in weights[group]])
+
+
+def pack_params(inputs_dict):
+    return _buffer([inputs_dict.get(name, PARAM_DEFAULTS[name]) for name in PARAM_FIELDS])
+
+
+def pack_skill_pairs(user_skills_df, required_skills_df):
+    # Same pairs as the inner merge in calculate_skills_match_score, without pandas
+    if user_skills_df is None or required_skills_df is None or user_skills_df.empty or required_skills_df.empty:
+        return _buffer([]), _buffer([]), _buffer([]), 0.0
+    required_rows = {}
+    for name, required, importance in zip(required_skills_df['skill_name'].tolist(),
+                                          required_skills_df['required_skill_score'].tolist(),
+                                          required_skills_df['skill_importance'].tolist()):
+        required_rows.setdefault(name, []).append((float(required), float(importance)))
+
+    individual, required, importance = [], [], []
+    for name, score in zip(user_skills_df['skill_name'].tolist(), user_skills_df['individual_skill_score'].tolist()):
+        for req, imp in required_rows.get(name, ()):
+            individual.append(float(score))
+            required.append(req)
+            importance.append(imp)
+    total_importance = float(sum(imp for rows in required_rows.values() for _, imp in rows))
+    return _buffer(individual), _buffer(required), _buffer(importance), total_importance
+
+
+# ------------------------- Scoring -------------------------
+
+def score_packed(profile, occupation, weights, params, skill_pairs):
+    return score_kernel(profile, occupation, weights, params, *skill_pairs)
+
+
+def score_profile(inputs_dict, skill_pairs=None):
+    # Drop-in for compute_all_scores. Pass pre-packed skill_pairs to skip the
+    # per-call skill matching when the same skills are scored repeatedly.
+    model_version = inputs_dict.get('model_version', 'default')
+    if skill_pairs is None:
+        skill_pairs = pack_skill_pairs(inputs_dict.get('individual_skills_df'), inputs_dict.get('required_skills_df'))
+    out = score_kernel(
+        pack_profile(inputs_dict), pack_occupation(inputs_dict.get('occupation_row')),
+        pack_weights(model_version), pack_params(inputs_dict), *skill_pairs,
+    )
+    (vr_100, hr_100, synergy_pct, ai_r, ai_fluency, domain_expertise, adaptive_capacity,
+     s1, s2_raw, s2, s3, s4_raw, s4, ai_enh, job_growth_01, wage_prem, entry_acc, h_base_01,
+     m_growth, m_regional, skills_match, timing_factor, alignment) = (float(v) for v in out)
+    return {
+        'vr_score': vr_100,
+        'hr_score': hr_100,
+        'synergy_pct': synergy_pct,
+        'ai_r': ai_r,
+        'vr_breakdown': {
+            'AI-Fluency (01)': ai_fluency,
+            'Domain-Expertise (01)': domain_expertise,
+            'Adaptive-Capacity (01)': adaptive_capacity,
+            'S1 Technical AI Skills': min(1.0, max(0.0, s1)),
+            'S2 AI-Augmented Productivity (raw)': s2_raw,
+            'S2 (01)': s2,
+            'S3 Critical AI Judgment (01)': s3,
+            'S4 Learning Velocity (raw)': s4_raw,
+            'S4 (01)': s4,
+        },
+        'h_breakdown': {
+            'AI-Enhancement': ai_enh,
+            'Job Growth (01)': job_growth_01,
+            'Wage Premium': wage_prem,
+            'Entry Accessibility': entry_acc,
+            'H_base (01)': h_base_01,
+            'Growth Multiplier': m_growth,
+            'Regional Multiplier': m_regional,
+        },
+        'skills_match': skills_match,
+        'timing_factor': timing_factor,
+        'alignment': alignment,
+        'model_version': model_version,
+    }
+
+
+def warmup():
+    # Triggers JIT compilation (or loads it from the on-disk cache) ahead of the first request
+    score_profile({'individual_skills_df': pd.DataFrame({'skill_name': ['x'], 'individual_skill_score': [1.0]}),
+                   'required_skills_df': pd.DataFrame({'skill_name': ['x'], 'required_skill_score': [1.0], 'skill_importance': [1.0]})})
+
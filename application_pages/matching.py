@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import (
+    batch_hr_components,
+    batch_hr_score,
+    batch_synergy_and_ai_r,
+    batch_timing_factor,
+    batch_vr_components,
+    batch_vr_score,
+    profile_arrays,
+)
+
+
+# ------------------------- Candidate Pool -------------------------
+
+def build_candidate_pool(profiles_df, individual_skills_df, model_version=None, arrays=None):
+    # Precompute everything that does not depend on the target occupation:
+    # V^R and timing factor per profile, plus an inverted skill -> users index
+    # stored CSR-style (postings sorted by skill, offsets per skill code).
+    # arrays: pre-validated inputs (validation.validate_profiles) to skip coercion.
+    profiles_df = profiles_df.reset_index(drop=True)
+    user_ids = profiles_df['user_id'].to_numpy()
+    if arrays is None:
+        arrays = profile_arrays(profiles_df)
+    components = batch_vr_components(arrays, model_version=model_version)
+    vr_100 = batch_vr_score(components, model_version=model_version)
+    timing = batch_timing_factor(arrays['years_experience'])
+
+    skills = individual_skills_df[['user_id', 'skill_name', 'individual_skill_score']]
+    positions = pd.Index(user_ids).get_indexer(skills['user_id'])
+    scores = pd.to_numeric(skills['individual_skill_score'], errors='coerce').to_numpy(dtype=float)
+    keep = (positions >= 0) & ~np.isnan(scores)
+    positions = positions[keep]
+    scores = scores[keep]
+    codes, skill_names = pd.factorize(skills['skill_name'].to_numpy()[keep])
+
+    order = np.argsort(codes, kind='stable')
+    offsets = np.zeros(len(skill_names) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=len(skill_names)), out=offsets[1:])
+
+    return {
+        'user_ids': user_ids,
+        'components': components,
+        'vr_score': vr_100,
+        'timing_factor': timing,
+        'skill_codes': {name: code for code, name in enumerate(skill_names)},
+        'offsets': offsets,
+        'postings': positions[order].astype(np.int64),
+        'posting_scores': scores[order],
+    }
+
+
+def skill_postings(pool, skill_name):
+    code = pool['skill_codes'].get(skill_name)
+    if code is None:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=float)
+    start, end = pool['offsets'][code], pool['offsets'][code + 1]
+    return pool['postings'][start:end], pool['posting_scores'][start:end]
+
+
+# ------------------------- Occupation Index -------------------------
+
+def build_occupation_index(occupational_data_df, occupation_required_skills_df, lambda_val=0.3, gamma_val=0.2, model_version=None):
+    # H^R for every occupation in one pass, plus each occupation's required-skill vector
+    occupational_data_df = occupational_data_df.reset_index(drop=True)
+    hr_100 = batch_hr_score(batch_hr_components(occupational_data_df, model_version=model_version), lambda_val=lambda_val, gamma_val=gamma_val)
+
+    index = {}
+    grouped = dict(tuple(occupation_required_skills_df.groupby('occupation_name', sort=False)))
+    for i, name in enumerate(occupational_data_df['occupation_name']):
+        req = grouped.get(name)
+        if req is None:
+            req = occupation_required_skills_df.iloc[0:0]
+        index[name] = {
+            'hr_score': float(hr_100[i]),
+            'skill_names': req['skill_name'].to_numpy(),
+            'required_skill_score': req['required_skill_score'].to_numpy(dtype=float),
+            'skill_importance': req['skill_importance'].to_numpy(dtype=float),
+            'total_importance': float(req['skill_importance'].sum()),
+        }
+    return index
+
+
+# ------------------------- Reverse Matching -------------------------
+
+def score_candidates(pool, occupation):
+    # Skills match for every profile sharing at least one required skill.
+    # Same arithmetic as calculate_skills_match_score, accumulated per user with bincount.
+    n_users = len(pool['user_ids'])
+    weighted = np.zeros(n_users, dtype=float)
+    hits = np.zeros(n_users, dtype=np.int64)
+    for skill_name, req_score, importance in zip(occupation['skill_names'], occupation['required_skill_score'], occupation['skill_importance']):
+        positions, scores = skill_postings(pool, skill_name)
+        if len(positions) == 0:
+            continue
+        contrib = (np.minimum(scores, req_score) / 100.0) * importance
+        weighted += np.bincount(positions, weights=contrib, minlength=n_users)
+        hits += np.bincount(positions, minlength=n_users)
+
+    candidates = np.flatnonzero(hits)
+    total_importance = occupation['total_importance']
+    if total_importance == 0:
+        skills_match = np.zeros(len(candidates), dtype=float)
+    else:
+        skills_match = weighted[candidates] / total_importance * 100.0
+    return candidates, skills_match
+
+
+def find_best_candidates(pool, occupation_index, occupation_name, top_k=10, rank_by='ai_r', alpha=0.6, beta=0.15, max_possible_match=100.0):
+    if rank_by not in ('ai_r', 'synergy_pct'):
+        raise ValueError("rank_by must be 'ai_r' or 'synergy_pct'")
+    if occupation_name not in occupation_index:
+        raise KeyError(f"Unknown occupation: {occupation_name}")
+    occupation = occupation_index[occupation_name]
+
+    candidates, skills_match = score_candidates(pool, occupation)
+    columns = ['user_id', 'vr_score', 'hr_score', 'skills_match', 'alignment', 'synergy_pct', 'ai_r']
+    if len(candidates) == 0:
+        return pd.DataFrame(columns=columns)
+
+    vr_100 = pool['vr_score'][candidates]
+    hr_100 = occupation['hr_score']
+    alignment, synergy_pct, ai_r = batch_synergy_and_ai_r(
+        vr_100, hr_100, skills_match, pool['timing_factor'][candidates],
+        max_possible_match=max_possible_match, alpha=alpha, beta=beta,
+    )
+
+    key = ai_r if rank_by == 'ai_r' else synergy_pct
+    k = min(int(top_k), len(candidates))
+    if k <= 0:
+        return pd.DataFrame(columns=columns)
+    top = np.argpartition(-key, k - 1)[:k]
+    top = top[np.argsort(-key[top], kind='stable')]
+
+    return pd.DataFrame({
+        'user_id': pool['user_ids'][candidates[top]],
+        'vr_score': vr_100[top],
+        'hr_score': np.full(k, hr_100),
+        'skills_match': skills_match[top],
+        'alignment': alignment[top],
+        'synergy_pct': synergy_pct[top],
+        'ai_r': ai_r[top],
+    }, columns=columns)
@@ -1,10 +1,31 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from application_pages.core import compute_all_scores
+from application_pages.result_cache import shared_result_cache
+from application_pages.skills import normalize_skills, parse_skills_table, upsert_skills
+from application_pages.validation import validate_inputs, validate_occupations, validate_profiles
 
 
-def _ensure_defaults():
+# Page1 widget keys that other pages read. Streamlit discards a widget's state on
+# any run where the widget is not rendered, so app.py re-assigns them every run.
+SHARED_WIDGET_KEYS = [
+    'prompting_score', 'tools_score', 'understanding_score', 'datalit_score',
+    'output_quality_with_ai', 'output_quality_without_ai', 'time_without_ai', 'time_with_ai',
+    'errors_caught', 'total_ai_errors', 'appropriate_trust_decisions', 'total_decisions',
+    'delta_proficiency', 'delta_t_hours_invested',
+    'education_level', 'years_experience', 'portfolio_score', 'recognition_score', 'credentials_score',
+    'cognitive_flexibility', 'social_emotional_intelligence', 'strategic_career_management',
+    'selected_occupation_name', 'lambda_val', 'gamma_val', 'max_possible_match',
+]
+
+
+def keep_widget_state():
+    for key in SHARED_WIDGET_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+
+
+def ensure_defaults():
     if not hasattr(st.session_state, 'individual_profiles_df'):
         st.session_state.individual_profiles_df = pd.DataFrame()
     df = st.session_state.individual_profiles_df
@@ -64,8 +85,49 @@ def _get_selected_occupation_row(occupation_name):
     return row.iloc[0]
 
 
+def build_inputs():
+    occ_row = _get_selected_occupation_row(st.session_state.selected_occupation_name)
+    required_skills_df = st.session_state.occupation_required_skills_df[
+        st.session_state.occupation_required_skills_df['occupation_name'] == st.session_state.selected_occupation_name
+    ][['skill_name', 'required_skill_score', 'skill_importance']]
+
+    return {
+        'prompting_score': st.session_state.prompting_score,
+        'tools_score': st.session_state.tools_score,
+        'understanding_score': st.session_state.understanding_score,
+        'datalit_score': st.session_state.datalit_score,
+        'output_quality_with_ai': st.session_state.output_quality_with_ai,
+        'output_quality_without_ai': st.session_state.output_quality_without_ai,
+        'time_without_ai': st.session_state.time_without_ai,
+        'time_with_ai': st.session_state.time_with_ai,
+        'errors_caught': st.session_state.errors_caught,
+        'total_ai_errors': st.session_state.total_ai_errors,
+        'appropriate_trust_decisions': st.session_state.appropriate_trust_decisions,
+        'total_decisions': st.session_state.total_decisions,
+        'delta_proficiency': st.session_state.delta_proficiency,
+        'delta_t_hours_invested': st.session_state.delta_t_hours_invested,
+        'education_level': st.session_state.education_level,
+        'years_experience': st.session_state.years_experience,
+        'portfolio_score': st.session_state.portfolio_score,
+        'recognition_score': st.session_state.recognition_score,
+        'credentials_score': st.session_state.credentials_score,
+        'cognitive_flexibility': st.session_state.cognitive_flexibility,
+        'social_emotional_intelligence': st.session_state.social_emotional_intelligence,
+        'strategic_career_management': st.session_state.strategic_career_management,
+        'occupation_row': occ_row,
+        'lambda_val': st.session_state.lambda_val,
+        'gamma_val': st.session_state.gamma_val,
+        'individual_skills_df': st.session_state.individual_skills_df.copy(),
+        'required_skills_df': required_skills_df.copy(),
+        'max_possible_match': st.session_state.max_possible_match,
+        'alpha': st.session_state.alpha_weight,
+        'beta': st.session_state.beta_weight,
+        'model_version': st.session_state.get('model_version', 'default'),
+    }
+
+
 def run_page1():
-    _ensure_defaults()
+    ensure_defaults()
 
     st.header('Overview and Inputs')
     st.markdown(
@@ -170,15 +232,40 @@ def run_page1():
         with skill_cols[2]:
             add_btn = st.button('Add/Update Skill')
         if add_btn and new_skill_name.strip() != '':
-            df = st.session_state.individual_skills_df.copy()
-            mask = df['skill_name'].str.lower() == new_skill_name.strip().lower() if not df.empty else pd.Series([], dtype=bool)
-            if not df.empty and mask.any():
-                df.loc[mask, 'individual_skill_score'] = int(new_skill_score)
-            else:
-                df = pd.concat([df, pd.DataFrame({'user_id': [1], 'skill_name': [new_skill_name.strip()], 'individual_skill_score': [int(new_skill_score)]})], ignore_index=True)
-            st.session_state.individual_skills_df = df
+            st.session_state.individual_skills_df = upsert_skills(
+                st.session_state.individual_skills_df,
+                pd.DataFrame({'skill_name': [new_skill_name], 'individual_skill_score': [int(new_skill_score)]}),
+            )
             st.success(f"Skill '{new_skill_name}' saved.")
 
+        with st.expander('Bulk import skills'):
+            st.markdown('Upload a CSV/JSON file or paste a table with columns `skill_name` and `individual_skill_score`. Names are matched case-insensitively; existing skills are updated, new ones appended.')
+            uploaded = st.file_uploader('Skills file', type=['csv', 'json', 'tsv', 'txt'], key='skills_upload')
+            pasted = st.text_area('Or paste a table', value='', height=120, key='skills_paste')
+            if st.button('Import Skills'):
+                try:
+                    if uploaded is not None:
+                        fmt = 'json' if uploaded.name.lower().endswith('.json') else 'csv'
+                        incoming = parse_skills_table(uploaded.getvalue(), fmt=fmt)
+                    elif pasted.strip() != '':
+                        fmt = 'json' if pasted.lstrip()[:1] in ('[', '{') else 'csv'
+                        incoming = parse_skills_table(pasted, fmt=fmt)
+                    else:
+                        incoming = None
+                        st.info('Nothing to import.')
+                    if incoming is not None:
+                        clean, rejected = normalize_skills(incoming)
+                        st.session_state.individual_skills_df = upsert_skills(st.session_state.individual_skills_df, clean)
+                        # One recompute per import, and only if scores were already shown
+                        if st.session_state.get('current_scores') is not None:
+                            st.session_state.current_inputs = build_inputs()
+                            st.session_state.current_scores = shared_result_cache().get_or_compute(st.session_state.current_inputs)
+                        st.success(f'Imported {len(clean)} skills.')
+                        if len(rejected):
+                            st.warning(f'Skipped {len(rejected)} rows with a missing name or non-numeric score.')
+                except Exception as e:
+                    st.error(f'Could not import skills: {e}')
+
         # Optional remove tool
         if not st.session_state.individual_skills_df.empty:
             rm_col1, rm_col2 = st.columns([3, 1])
@@ -212,58 +299,40 @@ def run_page1():
             st.dataframe(st.session_state.occupation_required_skills_df, use_container_width=True)
         with st.expander('learning_pathways_df'):
             st.dataframe(st.session_state.learning_pathways_df, use_container_width=True)
+        with st.expander('pathway_skill_impacts_df'):
+            st.dataframe(st.session_state.pathway_skill_impacts_df, use_container_width=True)
+        with st.expander('Data quality report'):
+            profile_report = validate_profiles(st.session_state.individual_profiles_df)['report']
+            occupation_report = validate_occupations(st.session_state.occupational_data_df)['report']
+            if profile_report.empty and occupation_report.empty:
+                st.success('No issues found in profiles or occupations.')
+            else:
+                st.dataframe(pd.concat([profile_report.assign(table='individual_profiles_df'), occupation_report.assign(table='occupational_data_df')], ignore_index=True), use_container_width=True)
 
     st.divider()
     calc_col1, calc_col2 = st.columns([1, 1])
     with calc_col1:
         if st.button('Calculate AI-Readiness'):
             try:
-                occ_row = _get_selected_occupation_row(st.session_state.selected_occupation_name)
-                required_skills_df = st.session_state.occupation_required_skills_df[
-                    st.session_state.occupation_required_skills_df['occupation_name'] == st.session_state.selected_occupation_name
-                ][['skill_name', 'required_skill_score', 'skill_importance']]
-
-                inputs = {
-                    'prompting_score': st.session_state.prompting_score,
-                    'tools_score': st.session_state.tools_score,
-                    'understanding_score': st.session_state.understanding_score,
-                    'datalit_score': st.session_state.datalit_score,
-                    'output_quality_with_ai': st.session_state.output_quality_with_ai,
-                    'output_quality_without_ai': st.session_state.output_quality_without_ai,
-                    'time_without_ai': st.session_state.time_without_ai,
-                    'time_with_ai': st.session_state.time_with_ai,
-                    'errors_caught': st.session_state.errors_caught,
-                    'total_ai_errors': st.session_state.total_ai_errors,
-                    'appropriate_trust_decisions': st.session_state.appropriate_trust_decisions,
-                    'total_decisions': st.session_state.total_decisions,
-                    'delta_proficiency': st.session_state.delta_proficiency,
-                    'delta_t_hours_invested': st.session_state.delta_t_hours_invested,
-                    'education_level': st.session_state.education_level,
-                    'years_experience': st.session_state.years_experience,
-                    'portfolio_score': st.session_state.portfolio_score,
-                    'recognition_score': st.session_state.recognition_score,
-                    'credentials_score': st.session_state.credentials_score,
-                    'cognitive_flexibility': st.session_state.cognitive_flexibility,
-                    'social_emotional_intelligence': st.session_state.social_emotional_intelligence,
-                    'strategic_career_management': st.session_state.strategic_career_management,
-                    'occupation_row': occ_row,
-                    'lambda_val': st.session_state.lambda_val,
-                    'gamma_val': st.session_state.gamma_val,
-                    'individual_skills_df': st.session_state.individual_skills_df.copy(),
-                    'required_skills_df': required_skills_df.copy(),
-                    'max_possible_match': st.session_state.max_possible_match,
-                    'alpha': st.session_state.alpha_weight,
-                    'beta': st.session_state.beta_weight,
-                }
-                st.session_state.current_scores = compute_all_scores(inputs)
+                inputs = build_inputs()
+                checked = validate_inputs(inputs)
+                st.session_state.current_inputs = inputs
+                st.session_state.current_scores = shared_result_cache().get_or_compute(inputs)
                 st.success('Computed AI-Readiness scores. Navigate to "Scores & Insights" to view details.')
+                if not checked['report'].empty:
+                    # Scores use the values as entered; surface what the formulas will clamp or zero out
+                    if checked['valid']:
+                        st.warning('Some inputs are outside their expected range (see the action column):')
+                    else:
+                        st.error('Some inputs are invalid; the affected components score as zero or are clamped, so treat these scores with caution:')
+                    st.dataframe(checked['report'], use_container_width=True)
             except Exception as e:
                 st.error(f'Error during calculation: {e}')
 
     with calc_col2:
         if st.button('Reset Inputs to Defaults'):
             for k in list(st.session_state.keys()):
-                if k not in ['individual_profiles_df', 'occupational_data_df', 'learning_pathways_df', 'occupation_required_skills_df', 'individual_skills_df', 'alpha_weight', 'beta_weight', 'initialized', 'current_scores', 'selected_occupation_name', 'max_possible_match', 'lambda_val', 'gamma_val']:
+                if k not in ['individual_profiles_df', 'occupational_data_df', 'learning_pathways_df', 'pathway_skill_impacts_df', 'occupation_required_skills_df', 'individual_skills_df', 'alpha_weight', 'beta_weight', 'initialized', 'current_scores', 'selected_occupation_name', 'max_possible_match', 'lambda_val', 'gamma_val']:
                     del st.session_state[k]
-            _ensure_defaults()
+            ensure_defaults()
             st.warning('Inputs reset to defaults.')
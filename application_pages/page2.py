@@ -2,6 +2,62 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from application_pages.core import get_model_weights
+from application_pages.render import paginated_dataframe, scores_fingerprint
+from application_pages.result_cache import inputs_key
+from application_pages.uncertainty import simulate_uncertainty
+
+UNDERLYING_TABLES = ['individual_profiles_df', 'occupational_data_df', 'occupation_required_skills_df', 'individual_skills_df']
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _build_figures(fingerprint, vr_weights, _cs):
+    # Keyed on the scores fingerprint; _cs is excluded from hashing.
+    # cache_data hands every caller its own copy of the figures, so one
+    # session's figures are never shared with another's.
+    cs = _cs
+    w1, w2, w3 = vr_weights
+    vr_comp_weights = {
+        'AI-Fluency': w1 * float(cs['vr_breakdown']['AI-Fluency (01)']),
+        'Domain-Expertise': w2 * float(cs['vr_breakdown']['Domain-Expertise (01)']),
+        'Adaptive-Capacity': w3 * float(cs['vr_breakdown']['Adaptive-Capacity (01)']),
+    }
+    vr_df = pd.DataFrame({
+        'Component': list(vr_comp_weights.keys()),
+        'Weighted Share (0-1)': list(vr_comp_weights.values()),
+    })
+    fig_vr = px.bar(vr_df, x='Component', y='Weighted Share (0-1)', title='V^R Composition (Weighted, Normalized)')
+    fig_vr.update_layout(yaxis_tickformat='.0%', yaxis_range=[0, 1])
+
+    hb = cs['h_breakdown']
+    hb_df = pd.DataFrame({
+        'Component': ['AI-Enhancement', 'Job Growth (0-1)', 'Wage Premium', 'Entry Accessibility'],
+        'Value': [
+            float(hb['AI-Enhancement']),
+            float(hb['Job Growth (01)']),
+            float(hb['Wage Premium']),
+            float(hb['Entry Accessibility'])
+        ]
+    })
+    fig_h = px.bar(hb_df, x='Component', y='Value', title='H_base Components')
+
+    comp_df = pd.DataFrame({
+        'Metric': ['V^R', 'H^R', 'Synergy%'],
+        'Score': [cs['vr_score'], cs['hr_score'], cs['synergy_pct']],
+    })
+    fig_comp = px.bar(comp_df, x='Metric', y='Score', title='Components of Current Readiness')
+
+    return {
+        'vr': fig_vr,
+        'h_base': fig_h,
+        'components': fig_comp,
+    }
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _uncertainty_bands(key, n_samples, _inputs):
+    # Keyed on the canonical inputs hash; _inputs is excluded from hashing
+    return simulate_uncertainty(_inputs, n_samples=n_samples, seed=0)
 
 
 def run_page2():
@@ -24,44 +80,34 @@ def run_page2():
 
     st.divider()
 
+    vr_weights = tuple(get_model_weights(cs.get('model_version'))['idiosyncratic_readiness'])
+    figures = _build_figures(scores_fingerprint(cs), vr_weights, cs)
+
     # VR composition chart
     st.markdown("Breakdown of $V^R$ by components (weighted)")
-    vr_comp_weights = {
-        'AI-Fluency': 0.45 * float(cs['vr_breakdown']['AI-Fluency (01)']),
-        'Domain-Expertise': 0.35 * float(cs['vr_breakdown']['Domain-Expertise (01)']),
-        'Adaptive-Capacity': 0.20 * float(cs['vr_breakdown']['Adaptive-Capacity (01)']),
-    }
-    vr_df = pd.DataFrame({
-        'Component': list(vr_comp_weights.keys()),
-        'Weighted Share (0-1)': list(vr_comp_weights.values()),
-    })
-    fig_vr = px.bar(vr_df, x='Component', y='Weighted Share (0-1)', title='V^R Composition (Weighted, Normalized)')
-    fig_vr.update_layout(yaxis_tickformat='.0%', yaxis_range=[0, 1])
-    st.plotly_chart(fig_vr, use_container_width=True)
+    st.plotly_chart(figures['vr'], use_container_width=True)
 
     # H_base components chart
     st.markdown("Breakdown of $H_{\\text{base}}$ components (pre-multipliers)")
-    hb = cs['h_breakdown']
-    hb_df = pd.DataFrame({
-        'Component': ['AI-Enhancement', 'Job Growth (0-1)', 'Wage Premium', 'Entry Accessibility'],
-        'Value': [
-            float(hb['AI-Enhancement']),
-            float(hb['Job Growth (01)']),
-            float(hb['Wage Premium']),
-            float(hb['Entry Accessibility'])
-        ]
-    })
-    fig_h = px.bar(hb_df, x='Component', y='Value', title='H_base Components')
-    st.plotly_chart(fig_h, use_container_width=True)
+    st.plotly_chart(figures['h_base'], use_container_width=True)
 
     # Current AI-R composition vs raw components
     st.markdown("Current $AI\\text{-}R$ vs. its components")
-    comp_df = pd.DataFrame({
-        'Metric': ['V^R', 'H^R', 'Synergy%'],
-        'Score': [cs['vr_score'], cs['hr_score'], cs['synergy_pct']],
-    })
-    fig_comp = px.bar(comp_df, x='Metric', y='Score', title='Components of Current Readiness')
-    st.plotly_chart(fig_comp, use_container_width=True)
+    st.plotly_chart(figures['components'], use_container_width=True)
+
+    with st.expander("Uncertainty bands (Monte Carlo)"):
+        st.markdown("Self-reported inputs (the S1 sliders, Adaptive-Capacity sliders and the error/trust counts) are perturbed and pushed through the scoring formulas as one batch. Intervals are central 90%.")
+        inputs = st.session_state.get("current_inputs")
+        if inputs is None:
+            st.info("Recalculate on 'Overview & Inputs' to enable uncertainty bands.")
+        elif st.toggle("Compute uncertainty bands", value=False, key="page2_uncertainty"):
+            n_samples = st.select_slider("Samples", options=[1000, 5000, 10000, 50000], value=10000, key="page2_mc_samples")
+            bands = _uncertainty_bands(inputs_key(inputs), n_samples, inputs)
+            labels = {'vr_score': 'V^R', 'hr_score': 'H^R', 'synergy_pct': 'Synergy%', 'ai_r': 'AI-R'}
+            st.dataframe(pd.DataFrame([
+                {'Metric': labels[m], 'Point': b['point'], 'Mean': b['mean'], 'Lower (5%)': b['lo'], 'Upper (95%)': b['hi']}
+                for m, b in bands.items()
+            ]), use_container_width=True)
 
     with st.expander("Detailed Numbers and Definitions"):
         st.markdown("Key definitions and the final score formula:")
@@ -74,12 +120,9 @@ def run_page2():
             'alignment': cs['alignment'],
         }})
 
+    # Tables are only sent when requested, and then one page at a time
     with st.expander("Underlying DataFrames"):
-        st.write("individual_profiles_df")
-        st.dataframe(st.session_state.individual_profiles_df, use_container_width=True)
-        st.write("occupational_data_df")
-        st.dataframe(st.session_state.occupational_data_df, use_container_width=True)
-        st.write("occupation_required_skills_df")
-        st.dataframe(st.session_state.occupation_required_skills_df, use_container_width=True)
-        st.write("individual_skills_df")
-        st.dataframe(st.session_state.individual_skills_df, use_container_width=True)
+        if st.toggle("Show tables", value=False, key="page2_show_tables"):
+            for name in UNDERLYING_TABLES:
+                st.write(name)
+                paginated_dataframe(st.session_state[name], key=f"page2_{name}")
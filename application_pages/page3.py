@@ -1,15 +1,9 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from application_pages.core import compute_all_scores, simulate_pathway_impact
-
-
-def _get_selected_occupation_row(occupation_name):
-    df = st.session_state.occupational_data_df
-    row = df[df['occupation_name'] == occupation_name]
-    if row.empty:
-        return df.iloc[0]
-    return row.iloc[0]
+from application_pages.page1 import build_inputs, ensure_defaults
+from application_pages.pathways import project_pathways
+from application_pages.result_cache import shared_result_cache
 
 
 def run_page3():
@@ -27,82 +21,39 @@ def run_page3():
     completion_score = st.slider("Pathway Completion Score", 0.0, 1.0, 1.0, 0.05, help="Simulate completion extent.")
     mastery_score = st.slider("Pathway Mastery Score", 0.0, 1.0, 1.0, 0.05, help="Simulate mastery depth.")
 
-    # Build baseline inputs from session
-    occ_row = _get_selected_occupation_row(st.session_state.selected_occupation_name)
-    required_skills_df = st.session_state.occupation_required_skills_df[
-        st.session_state.occupation_required_skills_df['occupation_name'] == st.session_state.selected_occupation_name
-    ][['skill_name', 'required_skill_score', 'skill_importance']]
-
-    base_inputs = {
-        'prompting_score': st.session_state.prompting_score,
-        'tools_score': st.session_state.tools_score,
-        'understanding_score': st.session_state.understanding_score,
-        'datalit_score': st.session_state.datalit_score,
-        'output_quality_with_ai': st.session_state.output_quality_with_ai,
-        'output_quality_without_ai': st.session_state.output_quality_without_ai,
-        'time_without_ai': st.session_state.time_without_ai,
-        'time_with_ai': st.session_state.time_with_ai,
-        'errors_caught': st.session_state.errors_caught,
-        'total_ai_errors': st.session_state.total_ai_errors,
-        'appropriate_trust_decisions': st.session_state.appropriate_trust_decisions,
-        'total_decisions': st.session_state.total_decisions,
-        'delta_proficiency': st.session_state.delta_proficiency,
-        'delta_t_hours_invested': st.session_state.delta_t_hours_invested,
-        'education_level': st.session_state.education_level,
-        'years_experience': st.session_state.years_experience,
-        'portfolio_score': st.session_state.portfolio_score,
-        'recognition_score': st.session_state.recognition_score,
-        'credentials_score': st.session_state.credentials_score,
-        'cognitive_flexibility': st.session_state.cognitive_flexibility,
-        'social_emotional_intelligence': st.session_state.social_emotional_intelligence,
-        'strategic_career_management': st.session_state.strategic_career_management,
-        'occupation_row': occ_row,
-        'lambda_val': st.session_state.lambda_val,
-        'gamma_val': st.session_state.gamma_val,
-        'individual_skills_df': st.session_state.individual_skills_df.copy(),
-        'required_skills_df': required_skills_df.copy(),
-        'max_possible_match': st.session_state.max_possible_match,
-        'alpha': st.session_state.alpha_weight,
-        'beta': st.session_state.beta_weight,
-    }
+    # Build baseline inputs from session (same dict page1 scores)
+    ensure_defaults()
+    base_inputs = build_inputs()
+    required_skills_df = base_inputs['required_skills_df']
 
     # Baseline scores (reuse if available)
     baseline = st.session_state.get('current_scores', None)
     if baseline is None:
-        baseline = compute_all_scores(base_inputs)
-
-    # Current VR component levels (0..1)
-    current_ai_fluency = baseline['vr_breakdown']['AI-Fluency (01)']
-    current_domain_expertise = baseline['vr_breakdown']['Domain-Expertise (01)']
-    current_adaptive_capacity = baseline['vr_breakdown']['Adaptive-Capacity (01)']
-
-    # Apply pathway impacts
-    sim_ai_fluency, sim_domain_expertise, sim_adaptive_capacity = simulate_pathway_impact(
-        current_ai_fluency,
-        current_domain_expertise,
-        current_adaptive_capacity,
-        pathway_row['impact_ai_fluency'],
-        pathway_row['impact_domain_expertise'],
-        pathway_row['impact_adaptive_capacity'],
+        baseline = shared_result_cache().get_or_compute(base_inputs)
+
+    # Compute HR and skills match from baseline inputs
+    base_results = shared_result_cache().get_or_compute(base_inputs)
+
+    # Project every pathway at once: V^R components plus the skill gains each
+    # pathway adds, which move the skills match, alignment and Synergy%
+    projections = project_pathways(
+        base_results,
+        base_inputs['individual_skills_df'],
+        required_skills_df,
+        lp_df,
+        st.session_state.get('pathway_skill_impacts_df'),
+        alpha=st.session_state.alpha_weight,
+        beta=st.session_state.beta_weight,
+        max_possible_match=st.session_state.max_possible_match,
         completion_score=completion_score,
         mastery_score=mastery_score,
+        model_version=base_inputs['model_version'],
     )
-
-    # Compute HR and alignment from baseline inputs
-    base_results = compute_all_scores(base_inputs)
-
-    # Rebuild simulated V^R
-    vr_new_01 = max(0.0, min(1.0, 0.45 * float(sim_ai_fluency) + 0.35 * float(sim_domain_expertise) + 0.20 * float(sim_adaptive_capacity)))
-    vr_new_100 = vr_new_01 * 100.0
-
-    # Keep HR and alignment from base
-    hr_100 = base_results['hr_score']
-    alignment = base_results['alignment']
-
-    # New synergy and AI-R
-    synergy_new = (vr_new_100 * hr_100 * alignment) / 100.0
-    synergy_new = max(0.0, min(100.0, synergy_new))
-    ai_r_new = st.session_state.alpha_weight * vr_new_100 + (1.0 - st.session_state.alpha_weight) * hr_100 + st.session_state.beta_weight * synergy_new
+    projected = projections[projections['pathway_name'] == pathway_name].iloc[0]
+    vr_new_100 = float(projected['vr_score'])
+    hr_100 = float(projected['hr_score'])
+    synergy_new = float(projected['synergy_pct'])
+    ai_r_new = float(projected['ai_r'])
 
     # Comparison chart
     st.markdown("Current vs. Projected after pathway simulation")
@@ -125,6 +76,13 @@ def run_page3():
     c3.metric("Synergy % (new)", f"{synergy_new:.1f}")
     c4.metric("AI-R (new)", f"{ai_r_new:.1f}")
 
+    with st.expander("All pathways ranked by projected AI-R"):
+        st.dataframe(
+            projections[['pathway_name', 'vr_score', 'skills_match', 'synergy_pct', 'ai_r']]
+            .sort_values('ai_r', ascending=False).reset_index(drop=True),
+            use_container_width=True,
+        )
+
     with st.expander("Pathway parameters and impacts"):
         st.write({
             'pathway_name': pathway_name,
@@ -133,7 +91,9 @@ def run_page3():
             'impact_ai_fluency': float(pathway_row['impact_ai_fluency']),
             'impact_domain_expertise': float(pathway_row['impact_domain_expertise']),
             'impact_adaptive_capacity': float(pathway_row['impact_adaptive_capacity']),
-            'sim_ai_fluency (01)': float(sim_ai_fluency),
-            'sim_domain_expertise (01)': float(sim_domain_expertise),
-            'sim_adaptive_capacity (01)': float(sim_adaptive_capacity),
+            'sim_ai_fluency (01)': float(projected['ai_fluency']),
+            'sim_domain_expertise (01)': float(projected['domain_expertise']),
+            'sim_adaptive_capacity (01)': float(projected['adaptive_capacity']),
+            'skills_match (current -> projected)': f"{base_results['skills_match']:.1f} -> {projected['skills_match']:.1f}",
+            'alignment (current -> projected)': f"{base_results['alignment']:.3f} -> {projected['alignment']:.3f}",
         })
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import batch_pathway_projection
+
+PATHWAY_SKILL_COLUMNS = ['pathway_id', 'skill_name', 'skill_gain']
+
+
+# ------------------------- Pathway -> Skill Index -------------------------
+
+def pathway_required_entries(pathways_df, pathway_skill_impacts_df, required_skills_df, completion_score=1.0, mastery_score=1.0):
+    # Sparse (pathway, required skill) entries: only skill gains that touch a
+    # skill the occupation requires can move the skills match.
+    scale = float(completion_score) * float(mastery_score)
+    positions = pd.DataFrame({'pathway_id': pathways_df['pathway_id'].to_numpy(), 'pathway_pos': np.arange(len(pathways_df))})
+    if pathway_skill_impacts_df is None or pathway_skill_impacts_df.empty or required_skills_df is None or required_skills_df.empty:
+        return pd.DataFrame(columns=['pathway_pos', 'skill_name', 'gain', 'required_skill_score', 'skill_importance'])
+
+    gains = (
+        pathway_skill_impacts_df[PATHWAY_SKILL_COLUMNS]
+        .merge(positions, on='pathway_id', how='inner')
+        .groupby(['pathway_pos', 'skill_name'], as_index=False)['skill_gain'].sum()
+    )
+    gains['gain'] = gains['skill_gain'].astype(float) * scale
+    return gains[['pathway_pos', 'skill_name', 'gain']].merge(
+        required_skills_df[['skill_name', 'required_skill_score', 'skill_importance']], on='skill_name', how='inner'
+    )
+
+
+def _contribution(score, required, importance):
+    return (np.minimum(score, required) / 100.0) * importance
+
+
+# ------------------------- Skills-Match Gains -------------------------
+
+def skill_match_deltas(user_skills_df, required_skills_df, entries, n_pathways):
+    # Change in skills match (0-100 scale) per pathway for one user's skill table.
+    # Like calculate_skills_match_score, every matching skill row counts: a gain
+    # raises each row of that skill, and a skill the user lacks is added as one row.
+    total_importance = float(required_skills_df['skill_importance'].sum()) if required_skills_df is not None else 0.0
+    if len(entries) == 0 or total_importance == 0:
+        return np.zeros(n_pathways)
+    if user_skills_df is None or user_skills_df.empty:
+        rows = entries.assign(individual_skill_score=np.nan)
+    else:
+        rows = entries.merge(user_skills_df[['skill_name', 'individual_skill_score']], on='skill_name', how='left')
+
+    current = pd.to_numeric(rows['individual_skill_score'], errors='coerce').fillna(0.0).to_numpy(dtype=float)
+    gained = np.minimum(current + rows['gain'].to_numpy(dtype=float), 100.0)
+    required = rows['required_skill_score'].to_numpy(dtype=float)
+    importance = rows['skill_importance'].to_numpy(dtype=float)
+    delta = _contribution(gained, required, importance) - _contribution(current, required, importance)
+    return np.bincount(rows['pathway_pos'].to_numpy(dtype=np.int64), weights=delta, minlength=n_pathways) / total_importance * 100.0
+
+
+def population_skill_match_deltas(pool, required_skills_df, entries, n_pathways):
+    # N x P change in skills match for every profile in a candidate pool, with the
+    # same row semantics as skill_match_deltas. Each entry adds the "skill absent"
+    # gain to everyone; users holding the skill (found through the pool's inverted
+    # index) swap it, once, for the sum of their per-row gains.
+    n_users = len(pool['user_ids'])
+    total_importance = float(required_skills_df['skill_importance'].sum())
+    if len(entries) == 0 or total_importance == 0:
+        return np.zeros((n_users, n_pathways))
+
+    pathway_pos = entries['pathway_pos'].to_numpy(dtype=np.int64)
+    gain = entries['gain'].to_numpy(dtype=float)
+    required = entries['required_skill_score'].to_numpy(dtype=float)
+    importance = entries['skill_importance'].to_numpy(dtype=float)
+    absent_gain = _contribution(np.minimum(gain, 100.0), required, importance)
+
+    # Posting slices of every entry's skill, concatenated: one row per (entry, held skill row)
+    codes = entries['skill_name'].map(pool['skill_codes']).to_numpy(dtype=float)
+    held = ~np.isnan(codes)
+    codes = np.where(held, codes, 0).astype(np.int64)
+    starts = pool['offsets'][codes]
+    lengths = np.where(held, pool['offsets'][codes + 1] - starts, 0)
+    entry_of = np.repeat(np.arange(len(entries)), lengths)
+    within = np.arange(len(entry_of)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    rows = np.repeat(starts, lengths) + within
+    positions = pool['postings'][rows]
+    scores = pool['posting_scores'][rows]
+
+    held_gain = (_contribution(np.minimum(scores + gain[entry_of], 100.0), required[entry_of], importance[entry_of])
+                 - _contribution(scores, required[entry_of], importance[entry_of]))
+    cells = positions * n_pathways + pathway_pos[entry_of]
+    holder_pairs = np.unique(positions * len(entries) + entry_of)
+    holder_entries = holder_pairs % len(entries)
+    holder_cells = (holder_pairs // len(entries)) * n_pathways + pathway_pos[holder_entries]
+
+    size = n_users * n_pathways
+    deltas = (np.bincount(cells, weights=held_gain, minlength=size)
+              - np.bincount(holder_cells, weights=absent_gain[holder_entries], minlength=size)).reshape(n_users, n_pathways)
+    deltas += np.bincount(pathway_pos, weights=absent_gain, minlength=n_pathways)[None, :]
+    return deltas / total_importance * 100.0
+
+
+def population_pathway_alignment(result, pathways_df, pathway_skill_impacts_df, completion_score=1.0, mastery_score=1.0):
+    # N x P projected alignment for a score_population result
+    required_skills_df = result['required_skills_df']
+    entries = pathway_required_entries(pathways_df, pathway_skill_impacts_df, required_skills_df, completion_score, mastery_score)
+    deltas = population_skill_match_deltas(result['pool'], required_skills_df, entries, len(pathways_df))
+    max_match = float(result['max_possible_match']) if float(result['max_possible_match']) > 0 else 100.0
+    skills_match = result['skills_match'][:, None] + deltas
+    return skills_match, (skills_match / max_match) * result['timing_factor'][:, None]
+
+
+# ------------------------- Projection -------------------------
+
+def project_pathways(base_scores, user_skills_df, required_skills_df, pathways_df, pathway_skill_impacts_df,
+                     alpha=0.6, beta=0.15, max_possible_match=100.0, completion_score=1.0, mastery_score=1.0, model_version=None):
+    # Projected V^R, skills match, Synergy% and AI-R for every pathway in one batch,
+    # starting from a compute_all_scores result. H^R is unchanged by pathways.
+    n_pathways = len(pathways_df)
+    entries = pathway_required_entries(pathways_df, pathway_skill_impacts_df, required_skills_df, completion_score, mastery_score)
+    skills_match = float(base_scores['skills_match']) + skill_match_deltas(user_skills_df, required_skills_df, entries, n_pathways)
+
+    max_match = float(max_possible_match) if float(max_possible_match) > 0 else 100.0
+    alignment = (skills_match / max_match) * float(base_scores['timing_factor'])
+
+    vb = base_scores['vr_breakdown']
+    components = {
+        'ai_fluency': np.array([vb['AI-Fluency (01)']], dtype=float),
+        'domain_expertise': np.array([vb['Domain-Expertise (01)']], dtype=float),
+        'adaptive_capacity': np.array([vb['Adaptive-Capacity (01)']], dtype=float),
+    }
+    proj = batch_pathway_projection(
+        components, np.array([base_scores['hr_score']]), alignment.reshape(1, -1), pathways_df,
+        alpha=alpha, beta=beta, completion_score=completion_score, mastery_score=mastery_score, model_version=model_version,
+    )
+    return pd.DataFrame({
+        'pathway_id': pathways_df['pathway_id'].to_numpy(),
+        'pathway_name': pathways_df['pathway_name'].to_numpy(),
+        'ai_fluency': proj['ai_fluency'][0],
+        'domain_expertise': proj['domain_expertise'][0],
+        'adaptive_capacity': proj['adaptive_capacity'][0],
+        'vr_score': proj['vr_score'][0],
+        'hr_score': float(base_scores['hr_score']),
+        'skills_match': skills_match,
+        'alignment': alignment,
+        'synergy_pct': proj['synergy_pct'][0],
+        'ai_r': proj['ai_r'][0],
+    })
+
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import (
+    OCCUPATION_COLUMNS,
+    batch_growth_multiplier,
+    batch_hr_components,
+    batch_regional_multiplier,
+    batch_synergy_and_ai_r,
+    clip01,
+)
+from application_pages.core import DEFAULT_OCCUPATION_ROW
+from application_pages.matching import build_candidate_pool, score_candidates
+
+
+# ------------------------- Population Scoring -------------------------
+
+def score_population(profiles_df, individual_skills_df, occupation_row=None, required_skills_df=None,
+                     lambda_val=0.3, gamma_val=0.2, max_possible_match=100.0, alpha=0.6, beta=0.15, model_version=None,
+                     arrays=None):
+    # compute_all_scores for every profile against one occupation, as column arrays
+    if occupation_row is None:
+        occupation_row = DEFAULT_OCCUPATION_ROW
+    if required_skills_df is None:
+        required_skills_df = pd.DataFrame(columns=['skill_name', 'required_skill_score', 'skill_importance'])
+
+    pool = build_candidate_pool(profiles_df, individual_skills_df, model_version=model_version, arrays=arrays)
+    n = len(pool['user_ids'])
+
+    occ_df = pd.DataFrame([{name: occupation_row[name] for name in OCCUPATION_COLUMNS}])
+    hr = batch_hr_components(occ_df, model_version=model_version)
+    m_growth = float(batch_growth_multiplier(hr['current_job_postings'], hr['previous_job_postings'], lambda_val)[0])
+    m_regional = float(batch_regional_multiplier(hr['local_demand'], hr['national_avg_demand'], hr['remote_work_factor'], gamma_val)[0])
+    hr_100 = float(clip01(hr['h_base_01'][0] * m_growth * m_regional)) * 100.0
+
+    occupation = {
+        'skill_names': required_skills_df['skill_name'].to_numpy(),
+        'required_skill_score': required_skills_df['required_skill_score'].to_numpy(dtype=float),
+        'skill_importance': required_skills_df['skill_importance'].to_numpy(dtype=float),
+        'total_importance': float(required_skills_df['skill_importance'].sum()),
+    }
+    candidates, match = score_candidates(pool, occupation)
+    skills_match = np.zeros(n, dtype=float)
+    skills_match[candidates] = match
+
+    alignment, synergy_pct, ai_r = batch_synergy_and_ai_r(
+        pool['vr_score'], hr_100, skills_match, pool['timing_factor'],
+        max_possible_match=max_possible_match, alpha=alpha, beta=beta,
+    )
+
+    return {
+        'user_ids': pool['user_ids'],
+        'components': pool['components'],
+        'vr_score': pool['vr_score'],
+        'hr_score': np.full(n, hr_100),
+        'synergy_pct': synergy_pct,
+        'ai_r': ai_r,
+        'skills_match': skills_match,
+        'timing_factor': pool['timing_factor'],
+        'alignment': alignment,
+        'h_breakdown': {
+            'AI-Enhancement': float(hr['ai_enh'][0]),
+            'Job Growth (01)': float(hr['job_growth_01'][0]),
+            'Wage Premium': float(hr['wage_prem'][0]),
+            'Entry Accessibility': float(hr['entry_acc'][0]),
+            'H_base (01)': float(hr['h_base_01'][0]),
+            'Growth Multiplier': m_growth,
+            'Regional Multiplier': m_regional,
+        },
+        'model_version': 'default' if model_version is None else model_version,
+        'alpha': float(alpha),
+        'beta': float(beta),
+        # Kept for pathway projections (pathways.population_pathway_alignment)
+        'pool': pool,
+        'required_skills_df': required_skills_df,
+        'max_possible_match': float(max_possible_match),
+    }
+
+
+def population_record(result, i):
+    # Row i of a score_population result, shaped exactly like compute_all_scores' output
+    comps = result['components']
+    return {
+        'vr_score': float(result['vr_score'][i]),
+        'hr_score': float(result['hr_score'][i]),
+        'synergy_pct': float(result['synergy_pct'][i]),
+        'ai_r': float(result['ai_r'][i]),
+        'vr_breakdown': {
+            'AI-Fluency (01)': float(comps['ai_fluency'][i]),
+            'Domain-Expertise (01)': float(comps['domain_expertise'][i]),
+            'Adaptive-Capacity (01)': float(comps['adaptive_capacity'][i]),
+            'S1 Technical AI Skills': float(clip01(comps['s1'][i])),
+            'S2 AI-Augmented Productivity (raw)': float(comps['s2_raw'][i]),
+            'S2 (01)': float(comps['s2'][i]),
+            'S3 Critical AI Judgment (01)': float(comps['s3'][i]),
+            'S4 Learning Velocity (raw)': float(comps['s4_raw'][i]),
+            'S4 (01)': float(comps['s4'][i]),
+        },
+        'h_breakdown': dict(result['h_breakdown']),
+        'skills_match': float(result['skills_match'][i]),
+        'timing_factor': float(result['timing_factor'][i]),
+        'alignment': float(result['alignment'][i]),
+        'model_version': result['model_version'],
+    }
+
+
+def population_records(result):
+    return [population_record(result, i) for i in range(len(result['user_ids']))]
@@ -0,0 +1,44 @@
+import hashlib
+import json
+
+import numpy as np
+import streamlit as st
+
+
+# ------------------------- Fingerprints -------------------------
+
+def _json_default(obj):
+    if isinstance(obj, (np.integer, np.floating)):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def scores_fingerprint(scores):
+    # Stable content hash of a compute_all_scores result, used as a cache key
+    payload = json.dumps(scores, sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ------------------------- Paginated Tables -------------------------
+
+def paginated_dataframe(df, key, page_size=25):
+    # Sends one page of rows per rerun instead of the whole frame
+    n_rows = len(df)
+    n_pages = max(1, (n_rows + page_size - 1) // page_size)
+    # The page lives only in session state (no value= on the widget): seeded once,
+    # and pulled back when the table shrank below the stored page
+    page_key = f'{key}_page'
+    st.session_state.setdefault(page_key, 1)
+    if st.session_state[page_key] > n_pages:
+        st.session_state[page_key] = n_pages
+    c1, c2 = st.columns([1, 3])
+    with c1:
+        page = st.number_input('Page', min_value=1, max_value=n_pages, step=1, key=page_key)
+    start = (int(page) - 1) * page_size
+    view = df.iloc[start:start + page_size]
+    with c2:
+        st.caption(f'Rows {start + 1 if n_rows else 0}-{start + len(view)} of {n_rows}')
+    st.dataframe(view, use_container_width=True)
+    return view
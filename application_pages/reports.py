@@ -0,0 +1,259 @@
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from string import Template
+
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import batch_pathway_projection
+from application_pages.core import get_model_weights
+from application_pages.pathways import population_pathway_alignment
+
+REPORT_VERSION = 1
+PLOTLY_JS = 'https://cdn.plot.ly/plotly-2.32.0.min.js'
+
+METRIC_COLUMNS = ['vr_score', 'hr_score', 'synergy_pct', 'ai_r', 'vr_share_ai_fluency', 'vr_share_domain_expertise',
+                  'vr_share_adaptive_capacity', 'skills_match', 'alignment']
+
+H_BASE_LABELS = ['AI-Enhancement', 'Job Growth (01)', 'Wage Premium', 'Entry Accessibility']
+
+HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>AI-Readiness Report - $user_id</title>
+<script src="$plotly_js"></script>
+<style>
+body { font-family: sans-serif; margin: 2rem; color: #222; }
+table { border-collapse: collapse; margin: 1rem 0; }
+td, th { border: 1px solid #ccc; padding: 0.3rem 0.6rem; text-align: right; }
+th { background: #f3f3f3; }
+.chart { width: 720px; height: 360px; }
+</style>
+</head>
+<body>
+<h1>AI-Readiness Report</h1>
+<p>User: <strong>$user_id</strong> &middot; Model version: $model_version</p>
+<table>
+<tr><th>V^R (0-100)</th><th>H^R (0-100)</th><th>Synergy %</th><th>AI-R (0-100+)</th></tr>
+<tr><td>$vr_score</td><td>$hr_score</td><td>$synergy_pct</td><td>$ai_r</td></tr>
+</table>
+<div id="vr" class="chart"></div>
+<div id="hbase" class="chart"></div>
+<h2>Pathway projections</h2>
+<table>
+<tr><th>Pathway</th><th>V^R</th><th>Synergy %</th><th>AI-R</th></tr>
+$pathway_rows
+</table>
+<div id="pathways" class="chart"></div>
+<script>
+const LAYOUTS = $layouts;
+Plotly.newPlot('vr', [{type: 'bar', x: $vr_labels, y: $vr_values}], LAYOUTS.vr);
+Plotly.newPlot('hbase', [{type: 'bar', x: $h_labels, y: $h_values}], LAYOUTS.hbase);
+Plotly.newPlot('pathways', [
+  {type: 'bar', name: 'Current', x: $pathway_labels, y: $current_ai_r},
+  {type: 'bar', name: 'Projected', x: $pathway_labels, y: $projected_ai_r}
+], LAYOUTS.pathways);
+</script>
+</body>
+</html>
+""")
+
+
+# ------------------------- Report Rows -------------------------
+
+def build_report_table(result, pathways_df, pathway_skill_impacts_df=None):
+    # One float row per user with everything a report shows: page2 metrics,
+    # weighted V^R shares and the page3 projection for every pathway,
+    # including the skill gains each pathway adds to skills match and alignment.
+    w1, w2, w3 = get_model_weights(result['model_version'])['idiosyncratic_readiness']
+    comps = result['components']
+    alignment = result['alignment']
+    if pathway_skill_impacts_df is not None:
+        _, alignment = population_pathway_alignment(result, pathways_df, pathway_skill_impacts_df)
+    proj = batch_pathway_projection(
+        comps, result['hr_score'], alignment, pathways_df,
+        alpha=result['alpha'], beta=result['beta'], model_version=result['model_version'],
+    )
+    base = np.column_stack([
+        result['vr_score'], result['hr_score'], result['synergy_pct'], result['ai_r'],
+        w1 * comps['ai_fluency'], w2 * comps['domain_expertise'], w3 * comps['adaptive_capacity'],
+        result['skills_match'], result['alignment'],
+    ])
+    return np.hstack([base, proj['vr_score'], proj['synergy_pct'], proj['ai_r']])
+
+
+def _row_hashes(table, shared_digest):
+    # Content hash per user; shared_digest covers everything common to all reports
+    prefix = shared_digest.encode('utf-8')
+    table = np.ascontiguousarray(table)
+    return [hashlib.sha1(prefix + table[i].tobytes()).hexdigest() for i in range(len(table))]
+
+
+def _safe_name(user_id):
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', str(user_id))
+
+
+# ------------------------- Rendering (worker side) -------------------------
+
+def _fmt(x):
+    return f'{x:.1f}'
+
+
+def _script_json(obj):
+    # JSON safe inside an inline <script>: a name containing '</script>' or '<!--'
+    # cannot close the element or start markup
+    return json.dumps(obj).replace('<', '\\u003c').replace('>', '\\u003e').replace('&', '\\u0026')
+
+
+def _render_chunk(out_dir, shared, user_ids, table, formats):
+    n_pathways = len(shared['pathway_names'])
+    n_metrics = len(METRIC_COLUMNS)
+    h_values = _script_json(shared['h_values'])
+    h_labels = _script_json(H_BASE_LABELS)
+    vr_labels = _script_json(['AI-Fluency', 'Domain-Expertise', 'Adaptive-Capacity'])
+    pathway_labels = _script_json(shared['pathway_names'])
+    escaped_pathways = [html.escape(name) for name in shared['pathway_names']]
+
+    for user_id, row in zip(user_ids, table):
+        metrics = row[:n_metrics]
+        proj_vr = row[n_metrics:n_metrics + n_pathways]
+        proj_syn = row[n_metrics + n_pathways:n_metrics + 2 * n_pathways]
+        proj_ai_r = row[n_metrics + 2 * n_pathways:]
+        name = _safe_name(user_id)
+
+        if 'html' in formats:
+            pathway_rows = '\n'.join(
+                f'<tr><td style="text-align:left">{p}</td><td>{_fmt(v)}</td><td>{_fmt(s)}</td><td>{_fmt(a)}</td></tr>'
+                for p, v, s, a in zip(escaped_pathways, proj_vr, proj_syn, proj_ai_r)
+            )
+            page = HTML_TEMPLATE.substitute(
+                user_id=html.escape(str(user_id)),
+                plotly_js=PLOTLY_JS,
+                model_version=html.escape(shared['model_version']),
+                vr_score=_fmt(metrics[0]), hr_score=_fmt(metrics[1]), synergy_pct=_fmt(metrics[2]), ai_r=_fmt(metrics[3]),
+                pathway_rows=pathway_rows,
+                layouts=shared['layouts'],
+                vr_labels=vr_labels, vr_values=json.dumps([round(float(v), 4) for v in metrics[4:7]]),
+                h_labels=h_labels, h_values=h_values,
+                pathway_labels=pathway_labels,
+                current_ai_r=json.dumps([round(float(metrics[3]), 2)] * n_pathways),
+                projected_ai_r=json.dumps([round(float(v), 2) for v in proj_ai_r]),
+            )
+            with open(os.path.join(out_dir, 'html', f'{name}.html'), 'w', encoding='utf-8') as f:
+                f.write(page)
+
+        if 'csv' in formats:
+            lines = ['section,item,value']
+            lines += [f'metric,{col},{float(v):.6g}' for col, v in zip(METRIC_COLUMNS, metrics)]
+            lines += [f'h_base,{label},{float(v):.6g}' for label, v in zip(H_BASE_LABELS, shared['h_values'])]
+            for p, v, s, a in zip(shared['csv_pathway_names'], proj_vr, proj_syn, proj_ai_r):
+                lines += [f'pathway_vr,{p},{float(v):.6g}', f'pathway_synergy,{p},{float(s):.6g}', f'pathway_ai_r,{p},{float(a):.6g}']
+            with open(os.path.join(out_dir, 'csv', f'{name}.csv'), 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+    return len(user_ids)
+
+
+# ------------------------- Driver -------------------------
+
+def _chart_layouts():
+    # Built once per run and embedded verbatim in every report
+    return json.dumps({
+        'vr': {'title': 'V^R Composition (Weighted, Normalized)', 'yaxis': {'tickformat': '.0%', 'range': [0, 1]}},
+        'hbase': {'title': 'H_base Components'},
+        'pathways': {'title': 'AI-R: Current vs. Projected by Pathway', 'barmode': 'group'},
+    }, separators=(',', ':'))
+
+
+def _load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_manifest(path, manifest):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def generate_reports(result, pathways_df, out_dir, formats=('html', 'csv'), incremental=True,
+                     max_workers=None, chunk_size=2000, pathway_skill_impacts_df=None):
+    # Renders one report per user from a score_population result. Chunks are
+    # streamed to a process pool with at most 2 x workers in flight, so memory
+    # stays bounded regardless of population size. With incremental=True only
+    # users whose report content hash changed since the last run are rendered.
+    start = time.perf_counter()
+    for fmt in formats:
+        os.makedirs(os.path.join(out_dir, fmt), exist_ok=True)
+
+    table = build_report_table(result, pathways_df, pathway_skill_impacts_df)
+    user_ids = [str(u) for u in result['user_ids']]
+    pathway_names = [str(p) for p in pathways_df['pathway_name']]
+    shared = {
+        'model_version': str(result['model_version']),
+        'pathway_names': pathway_names,
+        'csv_pathway_names': [p.replace(',', ' ') for p in pathway_names],
+        'h_values': [round(float(result['h_breakdown'][label]), 4) for label in H_BASE_LABELS],
+        'layouts': _chart_layouts(),
+    }
+    shared_digest = hashlib.sha1(json.dumps([REPORT_VERSION, sorted(formats), shared], sort_keys=True).encode('utf-8')).hexdigest()
+    hashes = _row_hashes(table, shared_digest)
+
+    manifest_path = os.path.join(out_dir, 'manifest.json')
+    manifest = _load_manifest(manifest_path) if incremental else {}
+    # A matching hash only counts if every report file is still on disk
+    on_disk = [set(os.listdir(os.path.join(out_dir, fmt))) for fmt in formats]
+    todo = np.array([
+        i for i, (u, h) in enumerate(zip(user_ids, hashes))
+        if manifest.get(u) != h or any(f'{_safe_name(u)}.{fmt}' not in names for fmt, names in zip(formats, on_disk))
+    ], dtype=np.int64)
+
+    # Population summary is cheap to rewrite in full
+    summary = pd.DataFrame(table[:, :len(METRIC_COLUMNS)], columns=METRIC_COLUMNS)
+    summary.insert(0, 'user_id', user_ids)
+    n_metrics = len(METRIC_COLUMNS)
+    n_pathways = len(pathway_names)
+    for j, p in enumerate(pathway_names):
+        summary[f'projected_ai_r: {p}'] = table[:, n_metrics + 2 * n_pathways + j]
+    summary.to_csv(os.path.join(out_dir, 'summary.csv'), index=False)
+
+    rendered = 0
+    max_workers = max_workers or os.cpu_count() or 1
+
+    def collect(futures):
+        nonlocal rendered
+        for fut in futures:
+            idx = in_flight.pop(fut)
+            rendered += fut.result()
+            for i in idx:
+                manifest[user_ids[i]] = hashes[i]
+
+    in_flight = {}
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            for c in range(0, len(todo), int(chunk_size)):
+                idx = todo[c:c + int(chunk_size)]
+                future = pool.submit(_render_chunk, out_dir, shared, [user_ids[i] for i in idx], table[idx], tuple(formats))
+                in_flight[future] = idx
+                if len(in_flight) >= 2 * max_workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(list(in_flight))
+    finally:
+        # Record whatever finished so a rerun after a failure only redoes the rest
+        _write_manifest(manifest_path, manifest)
+    return {
+        'total': len(user_ids),
+        'rendered': rendered,
+        'skipped': len(user_ids) - len(todo),
+        'elapsed_s': time.perf_counter() - start,
+        'out_dir': out_dir,
+    }
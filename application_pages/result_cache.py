@@ -0,0 +1,268 @@
+import hashlib
+import json
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from application_pages.batch import OCCUPATION_COLUMNS, PROFILE_DEFAULTS
+from application_pages.core import DEFAULT_OCCUPATION_ROW, compute_all_scores, get_model_weights
+from application_pages.population import population_record, score_population
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    'QULAB_RESULT_CACHE',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'results.sqlite'),
+)
+
+INPUT_DEFAULTS = dict(
+    PROFILE_DEFAULTS,
+    lambda_val=0.3,
+    gamma_val=0.2,
+    max_possible_match=100.0,
+    alpha=0.6,
+    beta=0.15,
+)
+
+
+# ------------------------- Canonical Keys -------------------------
+
+def _canonical_rows(df, columns):
+    # Row order does not affect the skills match, so rows are sorted
+    if df is None or df.empty:
+        return []
+    rows = zip(*(df[c].tolist() for c in columns))
+    return sorted([str(r[0])] + [float(v) for v in r[1:]] for r in rows)
+
+
+def canonical_inputs(inputs_dict):
+    # Everything compute_all_scores reads, with its defaults applied, in a stable form
+    canon = {name: float(inputs_dict.get(name, default)) for name, default in INPUT_DEFAULTS.items()}
+    canon['education_level'] = str(inputs_dict.get('education_level', "Master's"))
+
+    occupation_row = inputs_dict.get('occupation_row')
+    if occupation_row is None:
+        occupation_row = DEFAULT_OCCUPATION_ROW
+    canon['occupation_row'] = {name: float(occupation_row[name]) for name in OCCUPATION_COLUMNS}
+
+    canon['individual_skills'] = _canonical_rows(inputs_dict.get('individual_skills_df'), ['skill_name', 'individual_skill_score'])
+    canon['required_skills'] = _canonical_rows(inputs_dict.get('required_skills_df'), ['skill_name', 'required_skill_score', 'skill_importance'])
+
+    # The version tag alone is not enough: a name can be re-registered with new weights
+    model_version = inputs_dict.get('model_version', 'default')
+    canon['model_version'] = model_version
+    canon['model_weights'] = {group: list(w) for group, w in get_model_weights(model_version).items()}
+    return canon
+
+
+def inputs_key(inputs_dict):
+    payload = json.dumps(canonical_inputs(inputs_dict), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ------------------------- SQLite Store -------------------------
+
+class ResultCache:
+    # Content-addressed store of compute_all_scores results shared by every
+    # process pointing at the same file. WAL mode lets readers proceed while
+    # one writer commits; busy_timeout serializes concurrent writers.
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=200_000, max_bytes=512 * 1024 * 1024, evict_every=256):
+        self.path = path
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self.evict_every = int(evict_every)
+        self._local = threading.local()
+        self._puts = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._conn() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                ' key TEXT PRIMARY KEY,'
+                ' model_version TEXT NOT NULL,'
+                ' payload TEXT NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' created REAL NOT NULL,'
+                ' last_access REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)')
+
+    def _conn(self):
+        # sqlite3 connections are not shared across threads; Streamlit runs sessions in threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA busy_timeout=30000')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key, touch_interval=60.0):
+        conn = self._conn()
+        row = conn.execute('SELECT payload, last_access FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        # Recency is only refreshed every touch_interval seconds to keep reads mostly write-free
+        if now - row[1] > touch_interval:
+            with conn:
+                conn.execute('UPDATE results SET last_access = ? WHERE key = ?', (now, key))
+        return json.loads(row[0])
+
+    def put_many(self, items):
+        # items: iterable of (key, model_version, result)
+        now = time.time()
+        rows = []
+        for key, model_version, result in items:
+            payload = json.dumps(result, default=float)
+            rows.append((key, model_version, payload, len(payload), now, now))
+        if not rows:
+            return 0
+        conn = self._conn()
+        with conn:
+            conn.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)', rows)
+        with self._lock:
+            self._puts += len(rows)
+            due = self._puts >= self.evict_every
+            if due:
+                self._puts = 0
+        if due:
+            self.evict()
+        return len(rows)
+
+    def put(self, key, model_version, result):
+        self.put_many([(key, model_version, result)])
+
+    def get_or_compute(self, inputs_dict):
+        key = inputs_key(inputs_dict)
+        result = self.get(key)
+        if result is None:
+            result = compute_all_scores(inputs_dict)
+            self.put(key, inputs_dict.get('model_version', 'default'), result)
+        return result
+
+    def stats(self):
+        count, total = self._conn().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+        return {'entries': int(count), 'bytes': int(total)}
+
+    def evict(self, low_water=0.9):
+        # LRU eviction down to low_water x the bounds once either bound is exceeded
+        stats = self.stats()
+        if stats['entries'] <= self.max_entries and stats['bytes'] <= self.max_bytes:
+            return 0
+        excess_entries = max(0, stats['entries'] - int(self.max_entries * low_water))
+        excess_bytes = max(0, stats['bytes'] - int(self.max_bytes * low_water))
+
+        conn = self._conn()
+        n_delete = excess_entries
+        if excess_bytes > 0:
+            freed = 0
+            n_bytes = 0
+            for (size,) in conn.execute('SELECT size FROM results ORDER BY last_access ASC'):
+                if freed >= excess_bytes:
+                    break
+                freed += size
+                n_bytes += 1
+            n_delete = max(n_delete, n_bytes)
+        with conn:
+            conn.execute(
+                'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_access ASC LIMIT ?)',
+                (n_delete,),
+            )
+        return n_delete
+
+    def clear(self):
+        with self._conn() as conn:
+            conn.execute('DELETE FROM results')
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def shared_result_cache():
+    # One ResultCache per process; all app sessions (threads) reuse it
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ResultCache()
+        return _shared_cache
+
+
+# ------------------------- Warm-Up -------------------------
+
+def _flat_scores(result):
+    flat = {k: v for k, v in result.items() if k not in ('vr_breakdown', 'h_breakdown', 'model_version')}
+    flat.update(result['vr_breakdown'])
+    flat.update(result['h_breakdown'])
+    return flat
+
+
+def result_mismatches(expected, actual, rel_tol=1e-9, abs_tol=1e-9):
+    # (output, expected, actual) for every numeric output of two compute_all_scores-shaped results that differ
+    actual_flat = _flat_scores(actual)
+    return [
+        (name, float(value), float(actual_flat[name]))
+        for name, value in _flat_scores(expected).items()
+        if not math.isclose(float(value), float(actual_flat[name]), rel_tol=rel_tol, abs_tol=abs_tol)
+    ]
+
+
+def warm_from_population(cache, profiles_df, individual_skills_df, occupation_row=None, required_skills_df=None,
+                         lambda_val=0.3, gamma_val=0.2, max_possible_match=100.0, alpha=0.6, beta=0.15,
+                         model_version=None, chunk_size=5000, verify=16, seed=0):
+    # Scores the population in one batch and stores each profile under the same
+    # key a per-user compute_all_scores call with those inputs would produce.
+    # `verify` sampled rows are first recomputed with compute_all_scores; any
+    # disagreement raises before anything is written, so the cache never serves
+    # a batch result that the interactive path would not have produced.
+    profiles_df = profiles_df.reset_index(drop=True)
+    version = 'default' if model_version is None else model_version
+    result = score_population(
+        profiles_df, individual_skills_df, occupation_row, required_skills_df,
+        lambda_val=lambda_val, gamma_val=gamma_val, max_possible_match=max_possible_match,
+        alpha=alpha, beta=beta, model_version=model_version,
+    )
+
+    empty_skills = individual_skills_df.iloc[0:0]
+    skills_by_user = dict(tuple(individual_skills_df.groupby('user_id', sort=False)))
+    shared = {
+        'occupation_row': occupation_row,
+        'required_skills_df': required_skills_df,
+        'lambda_val': lambda_val,
+        'gamma_val': gamma_val,
+        'max_possible_match': max_possible_match,
+        'alpha': alpha,
+        'beta': beta,
+        'model_version': version,
+    }
+
+    def row_inputs(row):
+        inputs = {k: v for k, v in row.items() if not (isinstance(v, float) and math.isnan(v))}
+        inputs.update(shared)
+        inputs['individual_skills_df'] = skills_by_user.get(row['user_id'], empty_skills)
+        return inputs
+
+    records = profiles_df.to_dict('records')
+    if verify and records:
+        rng = random.Random(seed)
+        for i in rng.sample(range(len(records)), min(int(verify), len(records))):
+            mismatches = result_mismatches(compute_all_scores(row_inputs(records[i])), population_record(result, i))
+            if mismatches:
+                raise ValueError(f"Batch score for user {records[i]['user_id']} differs from compute_all_scores: {mismatches[:5]}")
+
+    written = 0
+    batch = []
+    for i, row in enumerate(records):
+        inputs = row_inputs(row)
+        batch.append((inputs_key(inputs), version, population_record(result, i)))
+        if len(batch) >= chunk_size:
+            written += cache.put_many(batch)
+            batch = []
+    written += cache.put_many(batch)
+    return written
+
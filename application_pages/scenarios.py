@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import batch_hr_components, clip01
+from application_pages.core import get_model_weights
+from application_pages.matching import build_candidate_pool, build_occupation_index, score_candidates
+
+SCENARIO_DEFAULTS = {
+    'alpha': 0.6,
+    'beta': 0.15,
+    'lambda_val': 0.3,
+    'gamma_val': 0.2,
+}
+VR_WEIGHT_COLUMNS = ['w1', 'w2', 'w3']
+
+
+# ------------------------- Weight-Independent Cache -------------------------
+
+def build_scenario_cache(profiles_df, individual_skills_df, occupational_data_df, occupation_required_skills_df, occupation_name=None, max_possible_match=100.0, model_version=None):
+    # Everything here is independent of alpha/beta/lambda/gamma and the V^R weights,
+    # so it is computed once and reused for every scenario.
+    # Each profile targets profiles_df['occupation_name'] when present, else occupation_name.
+    profiles_df = profiles_df.reset_index(drop=True)
+    n = len(profiles_df)
+
+    pool = build_candidate_pool(profiles_df, individual_skills_df, model_version=model_version)
+    comps = pool['components']
+    vr_components = np.column_stack([comps['ai_fluency'], comps['domain_expertise'], comps['adaptive_capacity']])
+
+    occupational_data_df = occupational_data_df.reset_index(drop=True)
+    occ_names = list(occupational_data_df['occupation_name'])
+    if 'occupation_name' in profiles_df.columns:
+        targets = profiles_df['occupation_name'].to_numpy()
+    else:
+        if occupation_name is None:
+            occupation_name = occ_names[0]
+        targets = np.full(n, occupation_name, dtype=object)
+    occ_codes = pd.Index(occ_names).get_indexer(targets)
+    if (occ_codes < 0).any():
+        unknown = sorted(set(targets[occ_codes < 0]))
+        raise KeyError(f"Unknown occupation(s): {unknown}")
+
+    # Skills match per profile against its own target occupation
+    occupation_index = build_occupation_index(occupational_data_df, occupation_required_skills_df, model_version=model_version)
+    skills_match = np.zeros(n, dtype=float)
+    for code in np.unique(occ_codes):
+        candidates, match = score_candidates(pool, occupation_index[occ_names[code]])
+        in_occ = occ_codes[candidates] == code
+        skills_match[candidates[in_occ]] = match[in_occ]
+
+    max_match = float(max_possible_match) if float(max_possible_match) > 0 else 100.0
+    alignment = (skills_match / max_match) * pool['timing_factor']
+
+    hr = batch_hr_components(occupational_data_df, model_version=model_version)
+    prev = hr['previous_job_postings']
+    nad = np.where(hr['national_avg_demand'] > 0, hr['national_avg_demand'], 1.0)
+
+    return {
+        'user_ids': pool['user_ids'],
+        'model_version': model_version,
+        'vr_components': vr_components,
+        # Clipped sub-components feeding the composite weights (used by calibration)
+        'sub_scores': clip01(np.column_stack([comps['s1'], comps['s2'], comps['s3'], comps['s4']])),
+        'expertise_components': clip01(np.column_stack([comps['e_edu'], comps['e_exp'], comps['e_spec']])),
+        'h_components': clip01(np.column_stack([hr['ai_enh'], hr['job_growth_01'], hr['wage_prem'], hr['entry_acc']])),
+        'skills_match': skills_match,
+        'alignment': alignment,
+        'occupation_codes': occ_codes,
+        'occupation_names': occ_names,
+        'h_base': hr['h_base_01'],
+        'growth_ratio': np.divide(hr['current_job_postings'], prev, out=np.ones_like(prev), where=prev > 0),
+        'has_growth': prev > 0,
+        'regional_term': hr['local_demand'] / nad + hr['remote_work_factor'] - 1.0,
+    }
+
+
+def scenario_frame(scenarios, model_version=None):
+    # Accepts a DataFrame or list of dicts; missing parameters fall back to the app
+    # defaults and missing V^R weights to those of model_version
+    df = pd.DataFrame(scenarios).reset_index(drop=True)
+    vr_weights = get_model_weights(model_version)['idiosyncratic_readiness']
+    defaults = dict(SCENARIO_DEFAULTS, **dict(zip(VR_WEIGHT_COLUMNS, vr_weights)))
+    for name, default in defaults.items():
+        if name not in df.columns:
+            df[name] = default
+        else:
+            df[name] = pd.to_numeric(df[name], errors='coerce').fillna(default)
+    return df
+
+
+# ------------------------- Weight-Dependent Evaluation -------------------------
+
+def evaluate_scenarios(cache, scenarios):
+    # Returns S x N matrices (scenarios x profiles) for V^R, H^R, Synergy% and AI-R
+    sc = scenario_frame(scenarios, cache.get('model_version'))
+    weights = sc[VR_WEIGHT_COLUMNS].to_numpy(dtype=float)
+    alpha = sc['alpha'].to_numpy(dtype=float)[:, None]
+    beta = sc['beta'].to_numpy(dtype=float)[:, None]
+    lam = np.maximum(sc['lambda_val'].to_numpy(dtype=float), 0.0)[:, None]
+    gamma = sc['gamma_val'].to_numpy(dtype=float)[:, None]
+
+    vr_100 = np.clip(weights @ cache['vr_components'].T, 0.0, 1.0) * 100.0
+
+    # H^R per (scenario, occupation), then gathered onto profiles
+    m_growth = np.where(cache['has_growth'], np.power(cache['growth_ratio'], lam), 1.0)
+    m_regional = 1.0 + gamma * cache['regional_term']
+    hr_occ = np.clip(cache['h_base'] * m_growth * m_regional, 0.0, 1.0) * 100.0
+    hr_100 = hr_occ[:, cache['occupation_codes']]
+
+    synergy_pct = np.clip(vr_100 * hr_100 * cache['alignment'] / 100.0, 0.0, 100.0)
+    ai_r = alpha * vr_100 + (1.0 - alpha) * hr_100 + beta * synergy_pct
+
+    return {
+        'scenarios': sc,
+        'vr_score': vr_100,
+        'hr_score': hr_100,
+        'synergy_pct': synergy_pct,
+        'ai_r': ai_r,
+    }
+
+
+def summarize_scenarios(cache, scenarios, chunk_size=64, quantiles=(0.1, 0.5, 0.9)):
+    # Population statistics per scenario, evaluated in chunks so S x N never has to fit in memory at once
+    sc = scenario_frame(scenarios, cache.get('model_version'))
+    rows = []
+    for start in range(0, len(sc), int(chunk_size)):
+        chunk = sc.iloc[start:start + int(chunk_size)]
+        res = evaluate_scenarios(cache, chunk)
+        ai_r = res['ai_r']
+        qs = np.quantile(ai_r, quantiles, axis=1)
+        for i in range(len(chunk)):
+            row = chunk.iloc[i].to_dict()
+            row['mean_vr_score'] = float(res['vr_score'][i].mean())
+            row['mean_hr_score'] = float(res['hr_score'][i].mean())
+            row['mean_synergy_pct'] = float(res['synergy_pct'][i].mean())
+            row['mean_ai_r'] = float(ai_r[i].mean())
+            for q, values in zip(quantiles, qs):
+                row[f'ai_r_p{int(round(q * 100))}'] = float(values[i])
+            rows.append(row)
+    return pd.DataFrame(rows)
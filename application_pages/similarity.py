@@ -0,0 +1,263 @@
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import PROFILE_DEFAULTS, batch_vr_components, clip01, profile_arrays
+from application_pages.matching import build_candidate_pool
+
+# Per-profile features, all on a 0..1 scale: S1-S4, the Domain-Expertise
+# components and Adaptive-Capacity. The skill vector is appended after these.
+PROFILE_FEATURES = ['s1', 's2', 's3', 's4', 'e_edu', 'e_exp', 'e_spec', 'adaptive_capacity']
+
+SKILL_DIMS = 32
+SKILL_WEIGHT = 0.5
+
+
+# ------------------------- Feature Vectors -------------------------
+
+def _skill_hash(skill_names, dims):
+    # Feature hashing keeps the skill block a fixed width, so unseen skills can
+    # be inserted later without re-encoding the whole index
+    hashes = np.array([zlib.crc32(str(name).strip().lower().encode('utf-8')) for name in skill_names], dtype=np.int64)
+    buckets = hashes % dims
+    signs = np.where((hashes >> 16) & 1, 1.0, -1.0)
+    return buckets, signs
+
+
+def skill_vectors(positions, skill_names, scores, n_profiles, dims=SKILL_DIMS):
+    # N x dims hashed skill vectors from (profile position, skill name, 0-100 score) triples
+    if dims <= 0:
+        return np.zeros((n_profiles, 0), dtype=np.float32)
+    uniques, codes = np.unique(np.asarray(skill_names, dtype=object).astype(str), return_inverse=True)
+    buckets, signs = _skill_hash(uniques, dims)
+    flat = np.asarray(positions, dtype=np.int64) * dims + buckets[codes]
+    weights = signs[codes] * np.clip(np.asarray(scores, dtype=float), 0.0, 100.0) / 100.0
+    return np.bincount(flat, weights=weights, minlength=n_profiles * dims).reshape(n_profiles, dims).astype(np.float32)
+
+
+def profile_vectors(components, skills=None, skill_weight=SKILL_WEIGHT):
+    # Rows of [PROFILE_FEATURES..., skill_weight * skill vector]
+    base = np.column_stack([clip01(components[name]) for name in PROFILE_FEATURES]).astype(np.float32)
+    if skills is None or skills.shape[1] == 0:
+        return base
+    return np.hstack([base, np.float32(skill_weight) * skills])
+
+
+def pool_vectors(pool, skill_dims=SKILL_DIMS, skill_weight=SKILL_WEIGHT):
+    # Feature vectors for a matching.build_candidate_pool result, reusing its inverted skill index
+    n = len(pool['user_ids'])
+    names = np.empty(len(pool['postings']), dtype=object)
+    for name, code in pool['skill_codes'].items():
+        names[pool['offsets'][code]:pool['offsets'][code + 1]] = name
+    skills = skill_vectors(pool['postings'], names, pool['posting_scores'], n, dims=skill_dims)
+    return profile_vectors(pool['components'], skills, skill_weight)
+
+
+def inputs_vector(inputs_dict, skill_dims=SKILL_DIMS, skill_weight=SKILL_WEIGHT):
+    # Feature vector for one compute_all_scores inputs dict (e.g. the page1 profile)
+    row = {name: [inputs_dict.get(name, default)] for name, default in PROFILE_DEFAULTS.items()}
+    row['education_level'] = [inputs_dict.get('education_level', "Master's")]
+    components = batch_vr_components(profile_arrays(pd.DataFrame(row)), model_version=inputs_dict.get('model_version'))
+    skills_df = inputs_dict.get('individual_skills_df')
+    if skills_df is None or skills_df.empty:
+        skills = np.zeros((1, skill_dims), dtype=np.float32)
+    else:
+        scores = pd.to_numeric(skills_df['individual_skill_score'], errors='coerce').to_numpy(dtype=float)
+        keep = ~np.isnan(scores)
+        skills = skill_vectors(np.zeros(int(keep.sum()), dtype=np.int64), skills_df['skill_name'].to_numpy()[keep], scores[keep], 1, dims=skill_dims)
+    return profile_vectors(components, skills, skill_weight)[0]
+
+
+# ------------------------- Index -------------------------
+
+class SimilarityIndex:
+    # Euclidean k-NN over profile vectors.
+    # Below exact_threshold rows every query is one matrix product over all rows.
+    # Above it, rows are partitioned into k-means cells (IVF) and a query only scans
+    # the n_probe nearest cells. Inserted or rescored rows stay in a small "pending"
+    # set that is always scanned exactly, and are folded into the cells once the
+    # set outgrows pending_fraction of the index.
+
+    def __init__(self, dim, exact_threshold=50_000, n_lists=None, n_probe=8, pending_fraction=0.05, seed=0):
+        self.dim = int(dim)
+        self.exact_threshold = int(exact_threshold)
+        self.n_lists = n_lists
+        self.n_probe = int(n_probe)
+        self.pending_fraction = float(pending_fraction)
+        self._rng = np.random.default_rng(seed)
+
+        self._vectors = np.empty((1024, self.dim), dtype=np.float32)
+        self._sq_norms = np.empty(1024, dtype=np.float32)
+        self._ids = np.empty(1024, dtype=object)
+        self._row_of = {}
+        self._size = 0
+
+        self._centroids = None
+        self._cell_of = np.empty(0, dtype=np.int32)
+        self._cell_order = np.empty(0, dtype=np.int64)
+        self._cell_offsets = np.zeros(1, dtype=np.int64)
+        self._pending = np.empty(0, dtype=bool)
+
+    def __len__(self):
+        return self._size
+
+    # ---- inserts ----
+
+    def _grow(self, needed):
+        capacity = len(self._vectors)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ('_vectors', '_sq_norms', '_ids'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def add(self, ids, vectors):
+        # Inserts new profiles and overwrites the vectors of ids already indexed (rescored profiles)
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        ids = list(ids)
+        if len(ids) != len(vectors):
+            raise ValueError(f"Got {len(ids)} ids for {len(vectors)} vectors")
+
+        rows = np.empty(len(ids), dtype=np.int64)
+        new_ids = []
+        for i, user_id in enumerate(ids):
+            row = self._row_of.get(user_id)
+            if row is None:
+                row = self._size + len(new_ids)
+                self._row_of[user_id] = row
+                new_ids.append(user_id)
+            rows[i] = row
+        self._grow(self._size + len(new_ids))
+        if new_ids:
+            self._ids[self._size:self._size + len(new_ids)] = new_ids
+        self._size += len(new_ids)
+
+        # Last write wins when an id repeats within one call
+        self._vectors[rows] = vectors
+        self._sq_norms[rows] = np.einsum('ij,ij->i', vectors, vectors)
+        if self._centroids is not None:
+            self._pending = np.concatenate([self._pending, np.zeros(self._size - len(self._pending), dtype=bool)])
+            self._pending[rows] = True
+            if self._pending.sum() > self.pending_fraction * self._size:
+                self._assign_cells()
+        elif self._size >= self.exact_threshold:
+            self.rebuild()
+        return rows
+
+    # ---- partitioning ----
+
+    def rebuild(self, n_iter=10, sample_size=100_000):
+        # (Re)trains the k-means cells on a sample and reassigns every row
+        if self._size == 0:
+            return
+        n_lists = self.n_lists or int(np.clip(np.sqrt(self._size), 16, 4096))
+        n_lists = min(n_lists, self._size)
+        data = self._vectors[:self._size]
+        sample = data[self._rng.choice(self._size, size=min(sample_size, self._size), replace=False)]
+        centroids = sample[self._rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            labels = self._labels(sample, centroids)
+            counts = np.bincount(labels, minlength=n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+        self._centroids = centroids
+        self._assign_cells()
+
+    @classmethod
+    def _labels(cls, data, centroids, chunk_size=8192):
+        # Nearest centroid per row, chunked so the distance block stays small
+        sq_norms = np.einsum('ij,ij->i', centroids, centroids)
+        labels = np.empty(len(data), dtype=np.int32)
+        for start in range(0, len(data), chunk_size):
+            labels[start:start + chunk_size] = cls._nearest(data[start:start + chunk_size], centroids, 1, sq_norms)[:, 0]
+        return labels
+
+    def _assign_cells(self):
+        cells = self._labels(self._vectors[:self._size], self._centroids)
+        self._cell_of = cells
+        self._cell_order = np.argsort(cells, kind='stable')
+        self._cell_offsets = np.zeros(len(self._centroids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=len(self._centroids)), out=self._cell_offsets[1:])
+        self._pending = np.zeros(self._size, dtype=bool)
+
+    @staticmethod
+    def _nearest(queries, points, k, point_sq_norms=None):
+        # Indices of the k nearest points per query row (unsorted within the k)
+        if point_sq_norms is None:
+            point_sq_norms = np.einsum('ij,ij->i', points, points)
+        dist = point_sq_norms[None, :] - 2.0 * (queries @ points.T)
+        k = min(k, points.shape[0])
+        if k == points.shape[0]:
+            return np.broadcast_to(np.arange(k), (len(queries), k))
+        return np.argpartition(dist, k - 1, axis=1)[:, :k]
+
+    # ---- queries ----
+
+    def _candidates(self, query):
+        if self._centroids is None:
+            return None
+        cells = self._nearest(query[None, :], self._centroids, self.n_probe)[0]
+        rows = [self._cell_order[self._cell_offsets[c]:self._cell_offsets[c + 1]] for c in cells]
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        # Rescored rows may still sit in their old cell; their current vectors are scanned via pending
+        rows = rows[~self._pending[rows]]
+        return np.concatenate([rows, np.flatnonzero(self._pending)])
+
+    def search(self, query, k=10, exclude_ids=()):
+        # k nearest indexed profiles to one query vector, closest first
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        exclude_rows = [self._row_of[u] for u in exclude_ids if u in self._row_of]
+        rows = self._candidates(query)
+        if rows is None:
+            vectors, sq_norms = self._vectors[:self._size], self._sq_norms[:self._size]
+        else:
+            vectors, sq_norms = self._vectors[rows], self._sq_norms[rows]
+
+        dist = sq_norms - 2.0 * (vectors @ query) + float(query @ query)
+        if exclude_rows:
+            excluded = np.isin(np.arange(self._size) if rows is None else rows, exclude_rows)
+            dist[excluded] = np.inf
+        k = min(int(k), len(dist))
+        if k <= 0:
+            return pd.DataFrame({'user_id': [], 'distance': []})
+        top = np.argpartition(dist, k - 1)[:k] if k < len(dist) else np.arange(len(dist))
+        top = top[np.argsort(dist[top], kind='stable')]
+        top = top[np.isfinite(dist[top])]
+        found = top if rows is None else rows[top]
+        return pd.DataFrame({
+            'user_id': self._ids[found],
+            'distance': np.sqrt(np.maximum(dist[top], 0.0)),
+        })
+
+    def similar_to(self, user_id, k=10):
+        # Peers of an indexed profile, excluding the profile itself
+        row = self._row_of[user_id]
+        return self.search(self._vectors[row], k=k, exclude_ids=(user_id,))
+
+
+# ------------------------- Builders -------------------------
+
+def build_similarity_index(profiles_df, individual_skills_df, model_version=None, arrays=None,
+                           skill_dims=SKILL_DIMS, skill_weight=SKILL_WEIGHT, **index_kwargs):
+    pool = build_candidate_pool(profiles_df, individual_skills_df, model_version=model_version, arrays=arrays)
+    vectors = pool_vectors(pool, skill_dims=skill_dims, skill_weight=skill_weight)
+    index = SimilarityIndex(vectors.shape[1], **index_kwargs)
+    index.add(pool['user_ids'], vectors)
+    return index
+
+
+def peer_pathways(peers, completed_pathways_df, learning_pathways_df=None):
+    # How many of the peers completed each pathway. completed_pathways_df: user_id, pathway_id
+    taken = completed_pathways_df[completed_pathways_df['user_id'].isin(peers['user_id'])]
+    counts = taken.groupby('pathway_id').size().rename('peers').reset_index()
+    if learning_pathways_df is not None:
+        counts = counts.merge(learning_pathways_df[['pathway_id', 'pathway_name']], on='pathway_id', how='left')
+    counts['share'] = counts['peers'] / max(len(peers), 1)
+    return counts.sort_values('peers', ascending=False, kind='stable').reset_index(drop=True)
@@ -0,0 +1,80 @@
+import io
+import json
+
+import numpy as np
+import pandas as pd
+
+SKILL_COLUMNS = ['user_id', 'skill_name', 'individual_skill_score']
+
+# Accepted header spellings for imported tables (matched case-insensitively)
+NAME_ALIASES = ('skill_name', 'skill', 'name')
+SCORE_ALIASES = ('individual_skill_score', 'skill_score', 'score')
+
+
+# ------------------------- Parsing -------------------------
+
+def _rename_columns(df):
+    lower = {str(c).strip().lower(): c for c in df.columns}
+    name_col = next((lower[a] for a in NAME_ALIASES if a in lower), None)
+    score_col = next((lower[a] for a in SCORE_ALIASES if a in lower), None)
+    if name_col is None or score_col is None:
+        if df.shape[1] != 2:
+            raise ValueError("Expected columns 'skill_name' and 'individual_skill_score'")
+        name_col, score_col = df.columns
+    return df[[name_col, score_col]].set_axis(['skill_name', 'individual_skill_score'], axis=1)
+
+
+def parse_skills_table(data, fmt='csv'):
+    # data: str or bytes. fmt: 'csv' (any delimiter, sniffed) or 'json'
+    # (list of records or a {skill_name: score} mapping).
+    if isinstance(data, bytes):
+        data = data.decode('utf-8-sig')
+    if fmt == 'json':
+        payload = json.loads(data)
+        if isinstance(payload, dict):
+            df = pd.DataFrame({'skill_name': list(payload.keys()), 'individual_skill_score': list(payload.values())})
+        else:
+            df = pd.DataFrame(payload)
+    else:
+        df = pd.read_csv(io.StringIO(data), sep=None, engine='python')
+        lower = {str(c).strip().lower() for c in df.columns}
+        if df.shape[1] == 2 and not lower & set(NAME_ALIASES):
+            # Headerless two-column paste: first row is data
+            df = pd.read_csv(io.StringIO(data), sep=None, engine='python', header=None)
+    return _rename_columns(df)
+
+
+def normalize_skills(df):
+    # Strip names, coerce scores to ints in 0..100, keep the last occurrence of
+    # each (case-insensitive) name. Returns (clean, rejected).
+    names = df['skill_name'].astype(str).str.strip()
+    scores = pd.to_numeric(df['individual_skill_score'], errors='coerce')
+    bad = df['skill_name'].isna() | (names == '') | scores.isna()
+    rejected = df[bad]
+    clean = pd.DataFrame({
+        'skill_name': names[~bad],
+        'individual_skill_score': np.clip(scores[~bad].round(), 0, 100).astype(int),
+    })
+    clean = clean[~clean['skill_name'].str.lower().duplicated(keep='last')].reset_index(drop=True)
+    return clean, rejected
+
+
+# ------------------------- Upsert -------------------------
+
+def upsert_skills(existing_df, incoming_df, user_id=1):
+    # Case-insensitive merge in one pass: matching rows get the incoming score
+    # (existing spelling is kept), the rest are appended with a single concat.
+    incoming, _ = normalize_skills(incoming_df)
+    if existing_df is None or existing_df.empty:
+        return incoming.assign(user_id=user_id)[SKILL_COLUMNS]
+
+    existing = existing_df.copy()
+    existing_keys = existing['skill_name'].astype(str).str.strip().str.lower()
+    incoming_keys = incoming['skill_name'].str.lower()
+    score_by_key = pd.Series(incoming['individual_skill_score'].to_numpy(), index=incoming_keys.to_numpy())
+
+    matched = existing_keys.isin(score_by_key.index)
+    existing.loc[matched, 'individual_skill_score'] = existing_keys[matched].map(score_by_key).to_numpy()
+
+    new_rows = incoming[~incoming_keys.isin(existing_keys)].assign(user_id=user_id)[SKILL_COLUMNS]
+    return pd.concat([existing, new_rows], ignore_index=True)
@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import (
+    PROFILE_DEFAULTS,
+    batch_synergy_and_ai_r,
+    batch_vr_components,
+    batch_vr_score,
+    profile_arrays,
+)
+from application_pages.population import score_population
+
+# Absolute standard deviation of the self-reported inputs (in each input's own units).
+# The error/trust ratios are not given a fixed sd: they are resampled from a
+# Beta(k + 1, n - k + 1) posterior, so small denominators get wider spread.
+NOISE_DEFAULTS = {
+    'prompting_score': 0.05,
+    'tools_score': 0.05,
+    'understanding_score': 0.05,
+    'datalit_score': 0.05,
+    'cognitive_flexibility': 5.0,
+    'social_emotional_intelligence': 5.0,
+    'strategic_career_management': 5.0,
+}
+
+# Inputs that live on a bounded scale and must stay there after perturbation
+INPUT_BOUNDS = {
+    'prompting_score': (0.0, 1.0),
+    'tools_score': (0.0, 1.0),
+    'understanding_score': (0.0, 1.0),
+    'datalit_score': (0.0, 1.0),
+    'cognitive_flexibility': (0.0, 100.0),
+    'social_emotional_intelligence': (0.0, 100.0),
+    'strategic_career_management': (0.0, 100.0),
+}
+
+METRICS = ['vr_score', 'hr_score', 'synergy_pct', 'ai_r']
+
+
+# ------------------------- Sampling -------------------------
+
+def _resample_ratio(arrays, hits_name, total_name, rng):
+    # Replaces k with n * p, p ~ Beta(k + 1, n - k + 1); n == 0 is left alone (ratio stays 0)
+    total = arrays[total_name]
+    hits = np.clip(arrays[hits_name], 0.0, np.maximum(total, 0.0))
+    positive = total > 0
+    p = rng.beta(hits[positive] + 1.0, total[positive] - hits[positive] + 1.0)
+    sampled = hits.copy()
+    sampled[positive] = p * total[positive]
+    arrays[hits_name] = sampled
+
+
+def perturb_arrays(arrays, noise=None, rng=None):
+    # arrays: profile_arrays-style dict, already repeated once per sample
+    rng = np.random.default_rng() if rng is None else rng
+    noise = NOISE_DEFAULTS if noise is None else noise
+    out = dict(arrays)
+    for name, sd in noise.items():
+        if sd <= 0:
+            continue
+        values = out[name] + rng.normal(0.0, sd, size=out[name].shape)
+        lo, hi = INPUT_BOUNDS.get(name, (-np.inf, np.inf))
+        out[name] = np.clip(values, lo, hi)
+    _resample_ratio(out, 'errors_caught', 'total_ai_errors', rng)
+    _resample_ratio(out, 'appropriate_trust_decisions', 'total_decisions', rng)
+    return out
+
+
+def _sample_scores(arrays, hr_100, skills_match, timing_factor, max_possible_match, alpha, beta, model_version):
+    vr_100 = batch_vr_score(batch_vr_components(arrays, model_version=model_version), model_version=model_version)
+    hr_100 = np.broadcast_to(hr_100, vr_100.shape)
+    _, synergy_pct, ai_r = batch_synergy_and_ai_r(
+        vr_100, hr_100, skills_match, timing_factor,
+        max_possible_match=max_possible_match, alpha=alpha, beta=beta,
+    )
+    return {'vr_score': vr_100, 'hr_score': hr_100, 'synergy_pct': synergy_pct, 'ai_r': ai_r}
+
+
+# ------------------------- Population -------------------------
+
+def population_uncertainty(profiles_df, individual_skills_df, occupation_row=None, required_skills_df=None,
+                           lambda_val=0.3, gamma_val=0.2, max_possible_match=100.0, alpha=0.6, beta=0.15,
+                           model_version=None, n_samples=1000, ci=0.9, noise=None, seed=None, chunk_elements=2_000_000):
+    # Point estimates plus mean and central ci interval for each profile.
+    # Profiles are processed in chunks of chunk_elements // n_samples rows so the
+    # (profiles x samples) batch stays bounded in memory.
+    profiles_df = profiles_df.reset_index(drop=True)
+    rng = np.random.default_rng(seed)
+    point = score_population(
+        profiles_df, individual_skills_df, occupation_row, required_skills_df,
+        lambda_val=lambda_val, gamma_val=gamma_val, max_possible_match=max_possible_match,
+        alpha=alpha, beta=beta, model_version=model_version,
+    )
+
+    n = len(profiles_df)
+    n_samples = int(n_samples)
+    q = [(1.0 - ci) / 2.0, 1.0 - (1.0 - ci) / 2.0]
+    out = {'user_id': point['user_ids']}
+    for metric in METRICS:
+        out[metric] = point[metric]
+        out[f'{metric}_mean'] = np.empty(n)
+        out[f'{metric}_lo'] = np.empty(n)
+        out[f'{metric}_hi'] = np.empty(n)
+
+    rows_per_chunk = max(1, int(chunk_elements) // n_samples)
+    for start in range(0, n, rows_per_chunk):
+        stop = min(n, start + rows_per_chunk)
+        chunk = profiles_df.iloc[start:stop]
+        arrays = _repeat_arrays(chunk, n_samples)
+        arrays = perturb_arrays(arrays, noise=noise, rng=rng)
+        samples = _sample_scores(
+            arrays, point['hr_score'][start:stop].repeat(n_samples),
+            point['skills_match'][start:stop].repeat(n_samples),
+            point['timing_factor'][start:stop].repeat(n_samples),
+            max_possible_match, alpha, beta, model_version,
+        )
+        for metric in METRICS:
+            values = samples[metric].reshape(stop - start, n_samples)
+            lo, hi = np.quantile(values, q, axis=1)
+            out[f'{metric}_mean'][start:stop] = values.mean(axis=1)
+            out[f'{metric}_lo'][start:stop] = lo
+            out[f'{metric}_hi'][start:stop] = hi
+    return pd.DataFrame(out)
+
+
+def _repeat_arrays(profiles_df, n_samples):
+    arrays = profile_arrays(profiles_df)
+    return {name: np.repeat(values, n_samples) for name, values in arrays.items()}
+
+
+# ------------------------- Single Profile -------------------------
+
+def simulate_uncertainty(inputs_dict, n_samples=10_000, ci=0.9, noise=None, seed=None):
+    # Monte Carlo bands for one compute_all_scores input dict. The occupation
+    # side and the skills match are not self-reported, so they are computed
+    # once and broadcast across all samples.
+    profile = {name: [inputs_dict.get(name, default)] for name, default in PROFILE_DEFAULTS.items()}
+    profile['education_level'] = [inputs_dict.get('education_level', "Master's")]
+    profile['user_id'] = [0]
+    profiles_df = pd.DataFrame(profile)
+
+    skills = inputs_dict.get('individual_skills_df')
+    if skills is None or skills.empty:
+        skills = pd.DataFrame(columns=['user_id', 'skill_name', 'individual_skill_score'])
+    skills = skills[['skill_name', 'individual_skill_score']].assign(user_id=0)
+
+    result = population_uncertainty(
+        profiles_df, skills, inputs_dict.get('occupation_row'), inputs_dict.get('required_skills_df'),
+        lambda_val=inputs_dict.get('lambda_val', 0.3), gamma_val=inputs_dict.get('gamma_val', 0.2),
+        max_possible_match=inputs_dict.get('max_possible_match', 100.0),
+        alpha=inputs_dict.get('alpha', 0.6), beta=inputs_dict.get('beta', 0.15),
+        model_version=inputs_dict.get('model_version'),
+        n_samples=n_samples, ci=ci, noise=noise, seed=seed,
+    )
+    row = result.iloc[0]
+    return {
+        metric: {
+            'point': float(row[metric]),
+            'mean': float(row[f'{metric}_mean']),
+            'lo': float(row[f'{metric}_lo']),
+            'hi': float(row[f'{metric}_hi']),
+        }
+        for metric in METRICS
+    }
@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+
+from application_pages.batch import EDUCATION_FOUNDATION, OCCUPATION_COLUMNS, PROFILE_DEFAULTS
+
+# Per-column rules: valid range, whether out-of-range values are clamped (warning)
+# or rejected (error), and the default used when a value is missing. Defaults
+# match the ones compute_all_scores applies to missing keys, and filled-in defaults
+# are not range-checked (core scores them as-is). Rejected values are
+# never replaced by a default: out-of-range numbers are kept so they score exactly
+# as compute_all_scores scores them, non-numeric ones become NaN, and either way
+# the row is marked invalid.
+PROFILE_SCHEMA = {
+    'prompting_score': {'min': 0.0, 'max': 1.0, 'clamp': True},
+    'tools_score': {'min': 0.0, 'max': 1.0, 'clamp': True},
+    'understanding_score': {'min': 0.0, 'max': 1.0, 'clamp': True},
+    'datalit_score': {'min': 0.0, 'max': 1.0, 'clamp': True},
+    'output_quality_with_ai': {'min': 0.0, 'max': None, 'clamp': True},
+    'output_quality_without_ai': {'min': 0.0, 'max': None, 'clamp': False, 'exclusive_min': True},
+    'time_without_ai': {'min': 0.0, 'max': None, 'clamp': True},
+    'time_with_ai': {'min': 0.0, 'max': None, 'clamp': False, 'exclusive_min': True},
+    'errors_caught': {'min': 0.0, 'max': None, 'clamp': False, 'integer': True},
+    'total_ai_errors': {'min': 0.0, 'max': None, 'clamp': False, 'integer': True},
+    'appropriate_trust_decisions': {'min': 0.0, 'max': None, 'clamp': False, 'integer': True},
+    'total_decisions': {'min': 0.0, 'max': None, 'clamp': False, 'integer': True},
+    'delta_proficiency': {'min': None, 'max': None, 'clamp': False},
+    'delta_t_hours_invested': {'min': 0.0, 'max': None, 'clamp': False},
+    'years_experience': {'min': 0.0, 'max': 60.0, 'clamp': True},
+    'portfolio_score': {'min': 0.0, 'max': 1.0, 'clamp': True},
+    'recognition_score': {'min': 0.0, 'max': 1.0, 'clamp': True},
+    'credentials_score': {'min': 0.0, 'max': 1.0, 'clamp': True},
+    'cognitive_flexibility': {'min': 0.0, 'max': 100.0, 'clamp': True},
+    'social_emotional_intelligence': {'min': 0.0, 'max': 100.0, 'clamp': True},
+    'strategic_career_management': {'min': 0.0, 'max': 100.0, 'clamp': True},
+}
+for _name, _rule in PROFILE_SCHEMA.items():
+    _rule['default'] = PROFILE_DEFAULTS[_name]
+
+# Numerators that cannot exceed their denominators
+PROFILE_RATIO_RULES = [
+    ('errors_caught', 'total_ai_errors'),
+    ('appropriate_trust_decisions', 'total_decisions'),
+]
+
+EDUCATION_LEVELS = list(EDUCATION_FOUNDATION) + ['Other']
+
+OCCUPATION_SCHEMA = {
+    'ai_enhancement_score': {'min': 0.0, 'max': 1.0, 'clamp': True, 'default': 0.0},
+    'job_growth_rate_g': {'min': -1.0, 'max': None, 'clamp': True, 'default': 0.0},
+    'ai_skilled_wage': {'min': 0.0, 'max': None, 'clamp': False, 'default': 0.0},
+    'median_wage': {'min': 0.0, 'max': None, 'clamp': False, 'default': 0.0, 'exclusive_min': True},
+    'education_years_required': {'min': 0.0, 'max': None, 'clamp': True, 'default': 0.0},
+    'experience_years_required': {'min': 0.0, 'max': None, 'clamp': True, 'default': 0.0},
+    'current_job_postings': {'min': 0.0, 'max': None, 'clamp': False, 'default': 0.0},
+    'previous_job_postings': {'min': 0.0, 'max': None, 'clamp': False, 'default': 0.0, 'exclusive_min': True},
+    'remote_work_factor': {'min': 0.0, 'max': 1.0, 'clamp': True, 'default': 0.0},
+    'local_demand': {'min': 0.0, 'max': None, 'clamp': False, 'default': 1.0},
+    'national_avg_demand': {'min': 0.0, 'max': None, 'clamp': False, 'default': 1.0, 'exclusive_min': True},
+}
+
+REPORT_COLUMNS = ['row', 'column', 'value', 'issue', 'severity', 'action']
+
+
+# ------------------------- Column Checks -------------------------
+
+def _issues(rows, column, raw, issue, severity, action):
+    rows = np.flatnonzero(rows)
+    if len(rows) == 0:
+        return None
+    return pd.DataFrame({
+        'row': rows,
+        'column': column,
+        # object dtype throughout, so all-NaN values (missing cells) concat cleanly
+        'value': pd.Series(raw[rows], dtype=object),
+        'issue': issue,
+        'severity': severity,
+        'action': action,
+    })
+
+
+def _validate_numeric(raw, name, rule, n):
+    # Returns (clean float array, row-level error mask, list of issue frames).
+    # Numeric columns skip coercion entirely; masks are only applied when they hit.
+    # NaN marks a value that could not be read, so range checks skip it.
+    issues = []
+    default = float(rule['default'])
+    if raw is None:
+        raw = np.full(n, np.nan)
+        values = raw.copy()
+        missing = np.ones(n, dtype=bool)
+        bad = np.zeros(n, dtype=bool)
+    elif np.issubdtype(raw.dtype, np.number):
+        values = raw.astype(float)
+        missing = np.isnan(values)
+        bad = np.isinf(values)
+    else:
+        values = pd.to_numeric(pd.Series(raw), errors='coerce').to_numpy(dtype=float, copy=True)
+        missing = pd.isna(raw)
+        bad = (np.isnan(values) & ~missing) | np.isinf(values)
+
+    errors = bad
+    if missing.any():
+        issues.append(_issues(missing, name, raw, 'missing', 'warning', f'default {default}'))
+        values[missing] = default
+    if bad.any():
+        issues.append(_issues(bad, name, raw, 'non_numeric', 'error', 'set to NaN'))
+        values[bad] = np.nan
+
+    if rule.get('integer'):
+        fractional = (values != np.round(values)) & ~np.isnan(values)
+        if fractional.any():
+            issues.append(_issues(fractional, name, raw, 'not_integer', 'warning', 'rounded'))
+            values = np.round(values)
+
+    lo, hi = rule.get('min'), rule.get('max')
+    for bound, hit, issue in (
+        (lo, None if lo is None else (values <= lo if rule.get('exclusive_min') else values < lo), 'below_min'),
+        (hi, None if hi is None else values > hi, 'above_max'),
+    ):
+        if hit is None:
+            continue
+        hit = hit & ~missing
+        if not hit.any():
+            continue
+        if rule['clamp']:
+            issues.append(_issues(hit, name, raw, issue, 'warning', f'clamped to {bound}'))
+            values[hit] = bound
+        else:
+            issues.append(_issues(hit, name, raw, issue, 'error', 'kept'))
+            errors = errors | hit
+    return values, errors, issues
+
+
+def _report(issue_frames):
+    frames = [f for f in issue_frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    return pd.concat(frames, ignore_index=True).sort_values(['row', 'column'], kind='stable').reset_index(drop=True)
+
+
+# ------------------------- Profiles -------------------------
+
+def validate_profiles(profiles_df):
+    # Coerces, range-checks and clamps every profile column at once.
+    # Returns {'arrays': profile_arrays-compatible dict, 'valid': bool mask, 'report': per-row issues}.
+    # Scores for rows where valid is False should not be used.
+    n = len(profiles_df)
+    arrays = {}
+    errors = np.zeros(n, dtype=bool)
+    issue_frames = []
+    for name, rule in PROFILE_SCHEMA.items():
+        raw = profiles_df[name].to_numpy() if name in profiles_df.columns else None
+        values, col_errors, issues = _validate_numeric(raw, name, rule, n)
+        arrays[name] = values
+        errors |= col_errors
+        issue_frames.extend(issues)
+
+    # Clamping the numerator would raise S3, so these rows are flagged instead
+    for num, den in PROFILE_RATIO_RULES:
+        over = arrays[num] > arrays[den]
+        if over.any():
+            issue_frames.append(_issues(over, num, arrays[num], f'exceeds_{den}', 'error', 'kept'))
+            errors |= over
+
+    if 'education_level' in profiles_df.columns:
+        levels = profiles_df['education_level'].to_numpy(dtype=object)
+        missing = pd.isna(levels)
+        unknown = ~pd.Series(levels).isin(EDUCATION_LEVELS).to_numpy() & ~missing
+        issue_frames.append(_issues(missing, 'education_level', levels, 'missing', 'warning', "default Master's"))
+        issue_frames.append(_issues(unknown, 'education_level', levels, 'invalid_category', 'warning', 'scored as Other'))
+        arrays['education_level'] = np.where(missing, "Master's", levels)
+    else:
+        arrays['education_level'] = np.full(n, "Master's", dtype=object)
+
+    return {'arrays': arrays, 'valid': ~errors, 'report': _report(issue_frames)}
+
+
+# ------------------------- Occupations -------------------------
+
+def validate_occupations(occupational_data_df):
+    # Same checks for occupation columns; returns a cleaned copy of the frame
+    n = len(occupational_data_df)
+    clean = occupational_data_df.copy()
+    errors = np.zeros(n, dtype=bool)
+    issue_frames = []
+    for name in OCCUPATION_COLUMNS:
+        raw = occupational_data_df[name].to_numpy() if name in occupational_data_df.columns else None
+        values, col_errors, issues = _validate_numeric(raw, name, OCCUPATION_SCHEMA[name], n)
+        clean[name] = values
+        errors |= col_errors
+        issue_frames.extend(issues)
+    return {'frame': clean, 'valid': ~errors, 'report': _report(issue_frames)}
+
+
+# ------------------------- Single Inputs Dict -------------------------
+
+def validate_inputs(inputs_dict):
+    # Same checks for one compute_all_scores inputs dict (e.g. the page1 widgets).
+    # Only keys that are present are checked; absent keys take core's defaults anyway.
+    profile = {name: [inputs_dict[name]] for name in PROFILE_SCHEMA if name in inputs_dict}
+    if 'education_level' in inputs_dict:
+        profile['education_level'] = [inputs_dict['education_level']]
+    profiles = validate_profiles(pd.DataFrame(profile, index=[0]))
+    profile_report = profiles['report'][profiles['report']['issue'] != 'missing']
+
+    occupation_row = inputs_dict.get('occupation_row')
+    if occupation_row is None:
+        return {'valid': bool(profiles['valid'][0]), 'report': profile_report.drop(columns='row').reset_index(drop=True)}
+    occupations = validate_occupations(pd.DataFrame([{name: occupation_row[name] for name in OCCUPATION_COLUMNS if name in occupation_row}]))
+    occupation_report = occupations['report'][occupations['report']['issue'] != 'missing']
+    report = _report([profile_report, occupation_report]).drop(columns='row')
+    return {'valid': bool(profiles['valid'][0] and occupations['valid'][0]), 'report': report}
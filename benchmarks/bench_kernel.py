@@ -0,0 +1,71 @@
+"""Per-call latency of the single-profile kernel against compute_all_scores.
+
+    python benchmarks/bench_kernel.py --calls 20000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_pages.core import compute_all_scores  # noqa: E402
+from application_pages.kernel import (  # noqa: E402
+    HAVE_NUMBA,
+    pack_occupation,
+    pack_params,
+    pack_profile,
+    pack_skill_pairs,
+    pack_weights,
+    score_packed,
+    score_profile,
+    warmup,
+)
+
+SAMPLE_INPUTS = {
+    'prompting_score': 0.7, 'tools_score': 0.6, 'understanding_score': 0.8, 'datalit_score': 0.5,
+    'output_quality_with_ai': 85.0, 'output_quality_without_ai': 70.0, 'time_without_ai': 4.0, 'time_with_ai': 2.5,
+    'errors_caught': 8, 'total_ai_errors': 10, 'appropriate_trust_decisions': 15, 'total_decisions': 20,
+    'delta_proficiency': 0.4, 'delta_t_hours_invested': 20.0, 'education_level': "Master's", 'years_experience': 6.0,
+    'portfolio_score': 0.6, 'recognition_score': 0.4, 'credentials_score': 0.5,
+    'cognitive_flexibility': 70.0, 'social_emotional_intelligence': 65.0, 'strategic_career_management': 60.0,
+    'individual_skills_df': pd.DataFrame({'skill_name': ['Python', 'Data Visualization', 'Machine Learning', 'SQL'],
+                                          'individual_skill_score': [75, 60, 45, 80]}),
+    'required_skills_df': pd.DataFrame({'skill_name': ['Python', 'Data Visualization', 'Machine Learning'],
+                                        'required_skill_score': [80, 70, 60], 'skill_importance': [0.7, 0.8, 0.5]}),
+}
+
+
+def _per_call_us(fn, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def benchmark_kernel(n_calls=20_000, inputs=SAMPLE_INPUTS):
+    warmup()
+    skill_pairs = pack_skill_pairs(inputs['individual_skills_df'], inputs['required_skills_df'])
+    packed = (pack_profile(inputs), pack_occupation(inputs.get('occupation_row')), pack_weights(), pack_params(inputs))
+    return {
+        'numba': HAVE_NUMBA,
+        'compute_all_scores_us': _per_call_us(lambda: compute_all_scores(inputs), max(1, n_calls // 20)),
+        'score_profile_us': _per_call_us(lambda: score_profile(inputs), n_calls),
+        'score_profile_prepacked_skills_us': _per_call_us(lambda: score_profile(inputs, skill_pairs), n_calls),
+        'score_packed_us': _per_call_us(lambda: score_packed(*packed, skill_pairs), n_calls),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=20_000, help='Calls timed per kernel entry point')
+    args = parser.parse_args(argv)
+    print(json.dumps(benchmark_kernel(args.calls), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Times upsert_skills on a bulk import against the former row-by-row path.
+
+    python benchmarks/bench_skills.py --skills 10000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_pages.skills import upsert_skills  # noqa: E402
+
+
+def legacy_upsert(existing_df, incoming_df, user_id=1):
+    # The former one-row-at-a-time path from the Synergy tab, kept for comparison
+    df = existing_df
+    for name, score in zip(incoming_df['skill_name'], incoming_df['individual_skill_score']):
+        df = df.copy()
+        mask = df['skill_name'].str.lower() == name.strip().lower() if not df.empty else pd.Series([], dtype=bool)
+        if not df.empty and mask.any():
+            df.loc[mask, 'individual_skill_score'] = int(score)
+        else:
+            df = pd.concat([df, pd.DataFrame({'user_id': [user_id], 'skill_name': [name.strip()], 'individual_skill_score': [int(score)]})], ignore_index=True)
+    return df
+
+
+def import_tables(n_skills, n_existing=200, seed=0):
+    # Half the imported names collide (with different casing) with existing skills
+    rng = np.random.default_rng(seed)
+    existing = pd.DataFrame({
+        'user_id': 1,
+        'skill_name': [f'Skill {i}' for i in range(n_existing)],
+        'individual_skill_score': rng.integers(0, 101, n_existing),
+    })
+    names = [f'skill {i}' if i % 2 == 0 else f'New Skill {i}' for i in range(n_skills)]
+    incoming = pd.DataFrame({'skill_name': names, 'individual_skill_score': rng.integers(0, 101, n_skills)})
+    return existing, incoming
+
+
+def benchmark_upsert(n_skills=10_000, n_existing=200, legacy_rows=1_000, seed=0):
+    existing, incoming = import_tables(n_skills, n_existing, seed)
+
+    start = time.perf_counter()
+    upsert_skills(existing, incoming)
+    vectorized_s = time.perf_counter() - start
+
+    # The legacy path is quadratic, so it is only timed on a prefix
+    legacy_in = incoming.iloc[:legacy_rows]
+    start = time.perf_counter()
+    upsert_skills(existing, legacy_in)
+    vectorized_prefix_s = time.perf_counter() - start
+    start = time.perf_counter()
+    legacy_upsert(existing, legacy_in)
+    legacy_s = time.perf_counter() - start
+
+    return {
+        'n_skills': n_skills,
+        'vectorized_s': vectorized_s,
+        'legacy_rows': len(legacy_in),
+        'legacy_s': legacy_s,
+        'vectorized_prefix_s': vectorized_prefix_s,
+        'speedup_at_legacy_rows': legacy_s / max(vectorized_prefix_s, 1e-12),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--skills', type=int, default=10_000, help='Rows in the imported table')
+    parser.add_argument('--existing', type=int, default=200, help='Rows already in the skill table')
+    parser.add_argument('--legacy-rows', type=int, default=1_000, help='Prefix timed on the row-by-row path')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    print(json.dumps(benchmark_upsert(args.skills, args.existing, args.legacy_rows, args.seed), indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
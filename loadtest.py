@@ -0,0 +1,254 @@
+"""Local load test for the QuLab Streamlit app.
+
+Holds N simulated sessions open at once inside this one process, the way a
+single `streamlit run` replica does: every session is its own Streamlit
+AppTest driven from its own thread (a replica also runs one script thread per
+session), all sharing the imported modules, st.cache_* entries and the result
+cache. Each session moves through the three pages; the report gives per-rerun
+latency percentiles, the extra memory each open session costs and CPU use.
+Run it with increasing --sessions to find how many sessions one replica holds
+within a latency budget.
+
+    python loadtest.py --sessions 50 --iterations 10
+    python loadtest.py --sessions 200 --max-p95-ms 500   # exit 1 on regression
+
+Requires psutil (current RSS is the memory metric).
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+PAGE1_SLIDERS = {
+    'prompting_score': (0.0, 1.0),
+    'tools_score': (0.0, 1.0),
+    'understanding_score': (0.0, 1.0),
+    'datalit_score': (0.0, 1.0),
+    'years_experience': (0.0, 40.0),
+    'cognitive_flexibility': (0.0, 100.0),
+}
+
+
+# ------------------------- Process Metrics -------------------------
+
+def _process():
+    # Per-session memory is the growth in current RSS; peak RSS (getrusage) would
+    # be a different metric, so there is no fallback
+    try:
+        import psutil
+    except ImportError:
+        raise RuntimeError('loadtest.py needs psutil to measure memory per session: pip install psutil') from None
+    return psutil.Process()
+
+
+class _RssSampler(threading.Thread):
+    # Peak RSS while sessions run, sampled every interval seconds
+    def __init__(self, process, interval=0.05):
+        super().__init__(daemon=True)
+        self.process = process
+        self.interval = interval
+        self.peak = process.memory_info().rss
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, self.process.memory_info().rss)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+        return self.peak
+
+
+def _percentiles(samples_ms):
+    if not samples_ms:
+        return {}
+    ordered = sorted(samples_ms)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
+
+    return {
+        'count': len(ordered),
+        'mean_ms': statistics.fmean(ordered),
+        'p50_ms': pct(50),
+        'p90_ms': pct(90),
+        'p95_ms': pct(95),
+        'p99_ms': pct(99),
+        'max_ms': ordered[-1],
+    }
+
+
+# ------------------------- Simulated Session -------------------------
+
+class SimulatedSession:
+    def __init__(self, session_id, timeout, seed):
+        from streamlit.testing.v1 import AppTest
+        self.session_id = session_id
+        self.rng = random.Random(seed)
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.latencies = {}
+
+    def _timed(self, action, fn):
+        start = time.perf_counter()
+        fn()
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.latencies.setdefault(action, []).append(elapsed_ms)
+        if self.at.exception:
+            raise RuntimeError(f'session {self.session_id} {action}: {self.at.exception[0].message}')
+
+    def _navigate(self, page):
+        nav = next(w for w in self.at.sidebar.selectbox if w.label == 'Navigation')
+        self._timed(f'navigate:{page}', lambda: nav.set_value(page).run())
+
+    def _button(self, label):
+        return next(b for b in self.at.button if b.label == label)
+
+    def start(self):
+        self._timed('initial_load', self.at.run)
+
+    def page1(self):
+        self._navigate('Overview & Inputs')
+        for key in self.rng.sample(list(PAGE1_SLIDERS), 2):
+            lo, hi = PAGE1_SLIDERS[key]
+            value = round(self.rng.uniform(lo, hi), 2)
+            self._timed('page1:slider', lambda: self.at.slider(key=key).set_value(value).run())
+        self._timed('page1:calculate', lambda: self._button('Calculate AI-Readiness').click().run())
+
+    def page2(self):
+        self._navigate('Scores & Insights')
+
+    def page3(self):
+        self._navigate('Pathway Simulation')
+        pathway = next(w for w in self.at.selectbox if w.label == 'Select Learning Pathway')
+        choice = self.rng.choice(list(pathway.options))
+        self._timed('page3:pathway', lambda: pathway.set_value(choice).run())
+
+
+def _drive(session, iterations, start_barrier, errors):
+    # Thread body: wait until every session is open, then run the page cycles
+    try:
+        start_barrier.wait()
+        session.start()
+        for _ in range(iterations):
+            session.page1()
+            session.page2()
+            session.page3()
+    except Exception as e:
+        errors[session.session_id] = str(e)
+
+
+def _warm_up(iterations, timeout, seed):
+    # One full session before the baseline: imports, JIT and st.cache_* entries
+    # are paid once per replica, not per session
+    session = SimulatedSession('warm-up', timeout, seed - 1)
+    session.start()
+    for _ in range(iterations):
+        session.page1()
+        session.page2()
+        session.page3()
+
+
+# ------------------------- Driver -------------------------
+
+def run_load_test(sessions=20, iterations=5, timeout=60.0, seed=0):
+    process = _process()
+    _warm_up(1, timeout, seed)
+    gc.collect()
+    rss_baseline = process.memory_info().rss
+
+    # Every AppTest stays referenced until RSS is read, so all N sessions are open at once
+    live = [SimulatedSession(i, timeout, seed + i) for i in range(sessions)]
+    errors = {}
+    start_barrier = threading.Barrier(sessions)
+    threads = [threading.Thread(target=_drive, args=(session, iterations, start_barrier, errors), daemon=True) for session in live]
+
+    sampler = _RssSampler(process)
+    sampler.start()
+    cpu_before = time.process_time()
+    wall_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_s = time.perf_counter() - wall_start
+    cpu_s = time.process_time() - cpu_before
+    gc.collect()
+    rss_sessions = process.memory_info().rss
+    rss_peak = sampler.stop()
+
+    finished = [session for session in live if session.session_id not in errors]
+    by_action = {}
+    for session in finished:
+        for action, samples in session.latencies.items():
+            by_action.setdefault(action, []).extend(samples)
+    all_samples = [ms for samples in by_action.values() for ms in samples]
+
+    return {
+        # A run only passes if every session finished every cycle
+        'ok': not errors and len(finished) == sessions and bool(all_samples),
+        'sessions': sessions,
+        'completed_sessions': len(finished),
+        'iterations': iterations,
+        'wall_s': wall_s,
+        'reruns_per_s': len(all_samples) / wall_s if wall_s > 0 else 0.0,
+        'cpu_s': cpu_s,
+        'cpu_cores_used': cpu_s / wall_s if wall_s > 0 else 0.0,
+        'baseline_rss_mb': rss_baseline / 1e6,
+        'sessions_rss_mb': rss_sessions / 1e6,
+        'peak_rss_mb': rss_peak / 1e6,
+        # (RSS with N sessions open - RSS after imports and one warm-up session) / N
+        'memory_per_session_mb': (rss_sessions - rss_baseline) / 1e6 / sessions if sessions else 0.0,
+        'latency': _percentiles(all_samples),
+        'latency_by_action': {action: _percentiles(samples) for action, samples in sorted(by_action.items())},
+        'errors': [f'session {i}: {error}' for i, error in sorted(errors.items())][:20],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=20, help='Sessions held open at the same time')
+    parser.add_argument('--iterations', type=int, default=5, help='Page1 -> page2 -> page3 cycles per session')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Per-rerun timeout in seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache-path', default=None, help='Result cache file (default: a fresh temporary file)')
+    parser.add_argument('--max-p95-ms', type=float, default=None, help='Exit 1 if overall p95 rerun latency exceeds this')
+    parser.add_argument('--output', default=None, help='Write the JSON report to this file')
+    args = parser.parse_args(argv)
+
+    # Must be set before the app imports the result cache module
+    os.environ['QULAB_RESULT_CACHE'] = args.cache_path or os.path.join(tempfile.mkdtemp(prefix='qulab-loadtest-'), 'results.sqlite')
+
+    try:
+        report = run_load_test(args.sessions, args.iterations, args.timeout, args.seed)
+    except RuntimeError as e:
+        print(f'FAILED: {e}', file=sys.stderr)
+        return 1
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+
+    if not report['ok']:
+        print(f"FAILED: {report['completed_sessions']}/{report['sessions']} sessions completed", file=sys.stderr)
+        for error in report['errors']:
+            print(f'  {error}', file=sys.stderr)
+        return 1
+    if args.max_p95_ms is not None and report['latency'].get('p95_ms', 0.0) > args.max_p95_ms:
+        print(f"p95 {report['latency']['p95_ms']:.1f} ms exceeds {args.max_p95_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
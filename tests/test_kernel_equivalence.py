@@ -0,0 +1,122 @@
+import math
+import random
+
+import pandas as pd
+import pytest
+
+from application_pages import kernel
+from application_pages.batch import EDUCATION_FOUNDATION
+from application_pages.core import DEFAULT_OCCUPATION_ROW, DEFAULT_WEIGHTS, MODEL_VERSIONS, compute_all_scores
+
+REL_TOL = 1e-9
+ABS_TOL = 1e-9
+
+EDGE_CASES = {
+    'defaults': {},
+    'zero_denominators': {'output_quality_without_ai': 0.0, 'time_with_ai': 0.0, 'total_ai_errors': 0, 'total_decisions': 0},
+    'zero_hours_invested': {'delta_proficiency': 0.5, 'delta_t_hours_invested': 0.0},
+    'negative_learning_and_experience': {'delta_proficiency': -2.0, 'delta_t_hours_invested': 1.0, 'years_experience': -3.0},
+    'out_of_range_inputs': {'education_level': 'Unknown', 'prompting_score': 1.7, 'cognitive_flexibility': 250.0},
+    'zero_wage_and_demand': {'occupation_row': dict(DEFAULT_OCCUPATION_ROW, previous_job_postings=0, median_wage=0, national_avg_demand=0)},
+    'negative_lambda': {'occupation_row': dict(DEFAULT_OCCUPATION_ROW, job_growth_rate_g=0.29), 'lambda_val': -1.0},
+    'shrinking_remote_free': {'occupation_row': dict(DEFAULT_OCCUPATION_ROW, job_growth_rate_g=-0.9, remote_work_factor=0.0), 'max_possible_match': 0.0},
+    'custom_model_version': {'model_version': '_kernel_check'},
+    'duplicate_skills': {
+        'individual_skills_df': pd.DataFrame({'skill_name': ['a', 'a', 'b'], 'individual_skill_score': [40.0, 90.0, 70.0]}),
+        'required_skills_df': pd.DataFrame({'skill_name': ['a', 'a', 'c'], 'required_skill_score': [80.0, 60.0, 50.0],
+                                            'skill_importance': [0.5, 0.2, 0.3]}),
+    },
+}
+
+
+@pytest.fixture(params=['python', 'numba'])
+def kernel_path(request, monkeypatch):
+    # The same kernel, JIT-compiled or run as plain Python over list buffers
+    if request.param == 'numba':
+        if not kernel.HAVE_NUMBA:
+            pytest.skip('numba is not installed')
+    elif kernel.HAVE_NUMBA:
+        monkeypatch.setattr(kernel, 'HAVE_NUMBA', False)
+        monkeypatch.setattr(kernel, 'score_kernel', kernel.score_kernel.py_func)
+        monkeypatch.setattr(kernel, '_clamp01', kernel._clamp01.py_func)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def kernel_check_version(monkeypatch):
+    # Scoped to each test: monkeypatch removes it from the registry afterwards
+    weights = dict(DEFAULT_WEIGHTS, ai_fluency=(0.25, 0.25, 0.25, 0.25), base_opportunity=(0.4, 0.2, 0.2, 0.2))
+    monkeypatch.setitem(MODEL_VERSIONS, '_kernel_check', weights)
+
+
+def _random_skills(rng, names, n, with_importance=False):
+    chosen = [rng.choice(names) for _ in range(n)]
+    if with_importance:
+        return pd.DataFrame({'skill_name': chosen, 'required_skill_score': [rng.uniform(0, 100) for _ in chosen],
+                             'skill_importance': [rng.uniform(0, 1) for _ in chosen]})
+    return pd.DataFrame({'skill_name': chosen, 'individual_skill_score': [rng.uniform(0, 100) for _ in chosen]})
+
+
+def _random_inputs(rng):
+    names = [f'skill {i}' for i in range(8)]
+    inputs = {
+        'prompting_score': rng.uniform(0, 1), 'tools_score': rng.uniform(0, 1),
+        'understanding_score': rng.uniform(0, 1), 'datalit_score': rng.uniform(0, 1),
+        'output_quality_with_ai': rng.uniform(0, 120), 'output_quality_without_ai': rng.uniform(0, 100),
+        'time_without_ai': rng.uniform(0, 10), 'time_with_ai': rng.uniform(0, 10),
+        'errors_caught': rng.randint(0, 30), 'total_ai_errors': rng.randint(0, 30),
+        'appropriate_trust_decisions': rng.randint(0, 40), 'total_decisions': rng.randint(0, 40),
+        'delta_proficiency': rng.uniform(-0.5, 1.5), 'delta_t_hours_invested': rng.choice([0.0, rng.uniform(0, 50)]),
+        'education_level': rng.choice(list(EDUCATION_FOUNDATION) + ['Other']),
+        'years_experience': rng.uniform(0, 40), 'portfolio_score': rng.uniform(0, 1),
+        'recognition_score': rng.uniform(0, 1), 'credentials_score': rng.uniform(0, 1),
+        'cognitive_flexibility': rng.uniform(0, 100), 'social_emotional_intelligence': rng.uniform(0, 100),
+        'strategic_career_management': rng.uniform(0, 100),
+        'occupation_row': {
+            'ai_enhancement_score': rng.uniform(0, 1), 'job_growth_rate_g': rng.uniform(-0.6, 0.6),
+            'ai_skilled_wage': rng.uniform(50_000, 200_000), 'median_wage': rng.uniform(0, 150_000),
+            'education_years_required': rng.randint(0, 8), 'experience_years_required': rng.randint(0, 10),
+            'current_job_postings': rng.uniform(0, 1000), 'previous_job_postings': rng.uniform(0, 1000),
+            'remote_work_factor': rng.uniform(0, 1), 'local_demand': rng.uniform(0, 2), 'national_avg_demand': rng.uniform(0, 2),
+        },
+        'lambda_val': rng.uniform(0, 1), 'gamma_val': rng.uniform(0, 1),
+        'max_possible_match': rng.choice([100.0, rng.uniform(0, 150)]),
+        'alpha': rng.uniform(0, 1), 'beta': rng.uniform(0, 1),
+        'model_version': rng.choice(['default', '_kernel_check']),
+    }
+    # Duplicates on either side are allowed, as in the pandas merge
+    inputs['individual_skills_df'] = _random_skills(rng, names, rng.randint(0, 6))
+    inputs['required_skills_df'] = _random_skills(rng, names, rng.randint(0, 6), with_importance=True)
+    return inputs
+
+
+def _flatten(scores):
+    flat = {k: v for k, v in scores.items() if k not in ('vr_breakdown', 'h_breakdown', 'model_version')}
+    flat.update(scores['vr_breakdown'])
+    flat.update(scores['h_breakdown'])
+    return flat
+
+
+def _mismatches(inputs):
+    expected = _flatten(compute_all_scores(inputs))
+    actual = _flatten(kernel.score_profile(inputs))
+    return {key: (float(value), actual[key]) for key, value in expected.items()
+            if not math.isclose(float(value), actual[key], rel_tol=REL_TOL, abs_tol=ABS_TOL)}
+
+
+@pytest.mark.parametrize('inputs', list(EDGE_CASES.values()), ids=list(EDGE_CASES))
+def test_edge_cases_match_compute_all_scores(kernel_path, inputs):
+    assert _mismatches(dict(inputs)) == {}
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_random_profiles_match_compute_all_scores(kernel_path, seed):
+    rng = random.Random(seed)
+    for i in range(100):
+        assert _mismatches(_random_inputs(rng)) == {}, f'profile {i} of seed {seed}'
+
+
+def test_prepacked_skill_pairs_match(kernel_path):
+    inputs = EDGE_CASES['duplicate_skills']
+    pairs = kernel.pack_skill_pairs(inputs['individual_skills_df'], inputs['required_skills_df'])
+    assert kernel.score_profile(inputs, pairs) == kernel.score_profile(inputs)
@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from application_pages.core import calculate_skills_match_score
+from application_pages.matching import build_candidate_pool
+from application_pages.pathways import pathway_required_entries, population_skill_match_deltas, skill_match_deltas
+
+
+def _apply_gains(user_skills_df, gains):
+    # Reference update: every row of a held skill gains, a missing skill becomes one new row
+    updated = user_skills_df.copy()
+    added = []
+    for skill_name, gain in gains.items():
+        held = updated['skill_name'] == skill_name
+        if held.any():
+            updated.loc[held, 'individual_skill_score'] = np.minimum(updated.loc[held, 'individual_skill_score'] + gain, 100.0)
+        else:
+            added.append({'skill_name': skill_name, 'individual_skill_score': min(gain, 100.0)})
+    return pd.concat([updated, pd.DataFrame(added, columns=updated.columns)], ignore_index=True) if added else updated
+
+
+# Held twice, held once, and not held; the occupation also lists 'skill 0' twice
+DUPLICATE_SKILL_CASE = {
+    'users': [
+        pd.DataFrame({'skill_name': ['skill 0', 'skill 0', 'skill 1'], 'individual_skill_score': [40.0, 90.0, 20.0]}),
+        pd.DataFrame({'skill_name': ['skill 2'], 'individual_skill_score': [10.0]}),
+        pd.DataFrame({'skill_name': [], 'individual_skill_score': []}),
+    ],
+    'required_skills_df': pd.DataFrame({'skill_name': ['skill 0', 'skill 0', 'skill 2'], 'required_skill_score': [80.0, 60.0, 70.0],
+                                        'skill_importance': [0.5, 0.2, 0.3]}),
+    'impacts': pd.DataFrame({'pathway_id': ['P0', 'P0', 'P1'], 'skill_name': ['skill 0', 'skill 2', 'skill 1'], 'skill_gain': [25.0, 30.0, 50.0]}),
+}
+
+
+def _random_case(seed, n_users=4, n_pathways=3):
+    rng = random.Random(seed)
+    names = [f'skill {i}' for i in range(6)]
+
+    def skills(n, **columns):
+        chosen = [rng.choice(names) for _ in range(n)]
+        return pd.DataFrame(dict({'skill_name': chosen}, **{k: [gen() for _ in chosen] for k, gen in columns.items()}))
+
+    impacts = [skills(rng.randint(0, 4), skill_gain=lambda: rng.uniform(0, 60)).assign(pathway_id=f'P{p}') for p in range(n_pathways)]
+    return {
+        'users': [skills(rng.randint(0, 6), individual_skill_score=lambda: rng.uniform(0, 100)) for _ in range(n_users)],
+        'required_skills_df': skills(rng.randint(1, 5), required_skill_score=lambda: rng.uniform(0, 100), skill_importance=lambda: rng.uniform(0, 1)),
+        'impacts': pd.concat(impacts, ignore_index=True),
+    }
+
+
+def _expected_and_actual(case):
+    # Projected skills match per (user, pathway): reference, single-user path, population path
+    required, impacts = case['required_skills_df'], case['impacts']
+    pathways_df = pd.DataFrame({'pathway_id': sorted(set(impacts['pathway_id'])) or ['P0']})
+    entries = pathway_required_entries(pathways_df, impacts, required)
+    n_pathways = len(pathways_df)
+
+    ids = list(range(len(case['users'])))
+    pool_skills = pd.concat([u.assign(user_id=uid) for uid, u in zip(ids, case['users'])], ignore_index=True)
+    pool = build_candidate_pool(pd.DataFrame({'user_id': ids}), pool_skills)
+    population = population_skill_match_deltas(pool, required, entries, n_pathways)
+
+    expected, single = [], []
+    for u, user_skills_df in enumerate(case['users']):
+        base = calculate_skills_match_score(user_skills_df, required)
+        single.append(base + skill_match_deltas(user_skills_df, required, entries, n_pathways))
+        row = []
+        for pathway_id in pathways_df['pathway_id']:
+            gains = impacts[impacts['pathway_id'] == pathway_id].groupby('skill_name')['skill_gain'].sum().to_dict()
+            row.append(calculate_skills_match_score(_apply_gains(user_skills_df, gains), required))
+        expected.append(row)
+        population[u] += base
+    return np.array(expected), np.array(single), population
+
+
+@pytest.mark.parametrize('case', [DUPLICATE_SKILL_CASE] + [_random_case(seed) for seed in range(200)])
+def test_projected_skills_match_equals_core(case):
+    expected, single, population = _expected_and_actual(case)
+    np.testing.assert_allclose(single, expected, rtol=0.0, atol=1e-9)
+    np.testing.assert_allclose(population, expected, rtol=0.0, atol=1e-9)
+
+
+def test_duplicate_skill_rows_each_gain():
+    # 'skill 0' is held at 40 and 90 against required 80 and 60 (importance 0.5, 0.2):
+    # +25 lifts 40 -> 65 against both requirements; 90 is already capped by both
+    _, single, population = _expected_and_actual(DUPLICATE_SKILL_CASE)
+    skill0_gain = ((65 - 40) / 100.0 * 0.5 + (60 - 40) / 100.0 * 0.2) / 1.0 * 100.0
+    skill2_gain = (30 / 100.0 * 0.3) / 1.0 * 100.0
+    base = calculate_skills_match_score(DUPLICATE_SKILL_CASE['users'][0], DUPLICATE_SKILL_CASE['required_skills_df'])
+    assert single[0][0] == pytest.approx(base + skill0_gain + skill2_gain)
+    assert population[0][0] == pytest.approx(base + skill0_gain + skill2_gain)
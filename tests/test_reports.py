@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+import pytest
+
+from application_pages.population import score_population
+from application_pages.reports import generate_reports
+
+PATHWAYS = pd.DataFrame({
+    'pathway_id': [1, 2],
+    'pathway_name': ['Prompting 101', '</script><script>alert("x")</script>'],
+    'impact_ai_fluency': [0.1, 0.0],
+    'impact_domain_expertise': [0.0, 0.1],
+    'impact_adaptive_capacity': [0.05, 0.05],
+})
+
+
+@pytest.fixture
+def result():
+    profiles = pd.DataFrame({'user_id': ['u1', 'u2'], 'prompting_score': [0.4, 0.9], 'years_experience': [2.0, 10.0]})
+    skills = pd.DataFrame({'user_id': ['u1', 'u2'], 'skill_name': ['Python', 'Python'], 'individual_skill_score': [50, 90]})
+    required = pd.DataFrame({'skill_name': ['Python'], 'required_skill_score': [80.0], 'skill_importance': [1.0]})
+    return score_population(profiles, skills, required_skills_df=required)
+
+
+def test_pathway_names_cannot_break_out_of_the_inline_script(result, tmp_path):
+    generate_reports(result, PATHWAYS, str(tmp_path), formats=('html',), max_workers=1)
+    page = (tmp_path / 'html' / 'u1.html').read_text(encoding='utf-8')
+    script = page[page.index('<script>\nconst LAYOUTS'):]
+    assert script.count('</script>') == 1
+    assert '&lt;/script&gt;' in page
+
+
+def test_incremental_run_rerenders_deleted_reports(result, tmp_path):
+    out_dir = str(tmp_path)
+    first = generate_reports(result, PATHWAYS, out_dir, max_workers=1)
+    assert first['rendered'] == 2
+
+    again = generate_reports(result, PATHWAYS, out_dir, max_workers=1)
+    assert again['rendered'] == 0 and again['skipped'] == 2
+
+    os.remove(os.path.join(out_dir, 'html', 'u2.html'))
+    repaired = generate_reports(result, PATHWAYS, out_dir, max_workers=1)
+    assert repaired['rendered'] == 1
+    assert os.path.exists(os.path.join(out_dir, 'html', 'u2.html'))
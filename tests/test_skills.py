@@ -0,0 +1,45 @@
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from application_pages.skills import normalize_skills, parse_skills_table, upsert_skills
+from benchmarks.bench_skills import import_tables, legacy_upsert
+
+
+@pytest.mark.parametrize('n_skills', [0, 1, 37, 500])
+def test_upsert_matches_row_by_row_path(n_skills):
+    existing, incoming = import_tables(n_skills, n_existing=50, seed=n_skills)
+    pdt.assert_frame_equal(upsert_skills(existing, incoming), legacy_upsert(existing, incoming), check_dtype=False)
+
+
+def test_upsert_keeps_existing_spelling_and_appends_new_skills():
+    existing = pd.DataFrame({'user_id': [1, 1], 'skill_name': ['Python', 'SQL'], 'individual_skill_score': [40, 50]})
+    incoming = pd.DataFrame({'skill_name': [' python ', 'Rust'], 'individual_skill_score': [90, 30]})
+    result = upsert_skills(existing, incoming)
+    assert list(result['skill_name']) == ['Python', 'SQL', 'Rust']
+    assert list(result['individual_skill_score']) == [90, 50, 30]
+
+
+def test_upsert_into_empty_table():
+    incoming = pd.DataFrame({'skill_name': ['Python'], 'individual_skill_score': [70]})
+    result = upsert_skills(None, incoming, user_id=7)
+    assert result.to_dict('records') == [{'user_id': 7, 'skill_name': 'Python', 'individual_skill_score': 70}]
+
+
+def test_normalize_clips_rejects_and_keeps_last_duplicate():
+    raw = pd.DataFrame({'skill_name': ['A', 'a', 'B', '', None], 'individual_skill_score': [10, 150, 'x', 5, 5]})
+    clean, rejected = normalize_skills(raw)
+    assert clean.to_dict('records') == [{'skill_name': 'a', 'individual_skill_score': 100}]
+    assert len(rejected) == 3
+
+
+@pytest.mark.parametrize('data, fmt', [
+    ('skill_name,individual_skill_score\nPython,80\nSQL,60\n', 'csv'),
+    ('Python\t80\nSQL\t60\n', 'csv'),
+    ('{"Python": 80, "SQL": 60}', 'json'),
+])
+def test_parse_skills_table_formats(data, fmt):
+    df = parse_skills_table(data, fmt)
+    assert list(df.columns) == ['skill_name', 'individual_skill_score']
+    assert df['skill_name'].tolist() == ['Python', 'SQL']
+    assert pd.to_numeric(df['individual_skill_score']).tolist() == [80, 60]
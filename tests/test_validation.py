@@ -0,0 +1,47 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from application_pages.validation import validate_inputs, validate_occupations, validate_profiles
+
+
+def test_missing_occupation_columns_are_defaults_not_errors():
+    result = validate_occupations(pd.DataFrame({'ai_enhancement_score': [0.5, 0.6]}))
+    assert result['valid'].tolist() == [True, True]
+    report = result['report']
+    assert set(report['issue']) == {'missing'}
+    assert not report.duplicated(['row', 'column']).any()
+
+
+def test_rejected_values_are_kept_and_invalidate_the_row():
+    result = validate_occupations(pd.DataFrame({'median_wage': [50_000.0, 0.0, 'n/a']}))
+    assert result['valid'].tolist() == [True, False, False]
+    wages = result['frame']['median_wage'].to_numpy()
+    assert wages[1] == 0.0 and np.isnan(wages[2])
+
+
+def test_clamped_values_warn_but_stay_valid():
+    result = validate_profiles(pd.DataFrame({'prompting_score': [1.5, 0.5], 'education_level': [None, 'PhD']}))
+    assert result['valid'].tolist() == [True, True]
+    assert result['arrays']['prompting_score'].tolist() == [1.0, 0.5]
+    assert result['arrays']['education_level'][0] == "Master's"
+
+
+def test_ratio_rule_is_an_error():
+    result = validate_profiles(pd.DataFrame({'errors_caught': [5], 'total_ai_errors': [3]}))
+    assert result['valid'].tolist() == [False]
+    assert 'exceeds_total_ai_errors' in set(result['report']['issue'])
+
+
+def test_reports_concat_without_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', FutureWarning)
+        validate_occupations(pd.DataFrame({'ai_enhancement_score': [0.5, np.nan]}))
+        validate_inputs({'prompting_score': 0.5, 'occupation_row': {'median_wage': 40_000.0}})
+
+
+def test_validate_inputs_ignores_absent_keys():
+    result = validate_inputs({'prompting_score': 0.4, 'occupation_row': {'median_wage': 40_000.0}})
+    assert result['valid'] is True
+    assert result['report'].empty